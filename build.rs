@@ -11,4 +11,50 @@ fn main() {
         "cargo:warning=Build flags: {:?}",
         config.build_flags.0.iter().collect::<Vec<_>>()
     );
+
+    // Patterns embedded as dense DFAs, see `src/builtin.rs`
+    generate_builtin_dfas(&[("hi_privet", r"(hi_how_are_you)|(hello)|(привет\d+)")]);
+}
+
+/// Serialize a forward/reverse dense DFA pair per builtin pattern into
+/// `OUT_DIR` and emit the table that `src/builtin.rs` includes.
+fn generate_builtin_dfas(patterns: &[(&str, &str)]) {
+    use regex_automata::dfa::{dense, regex::Builder};
+    use std::fmt::Write;
+
+    let out_dir = std::path::PathBuf::from(std::env::var("OUT_DIR").unwrap());
+    let big_endian = std::env::var("CARGO_CFG_TARGET_ENDIAN").as_deref() == Ok("big");
+
+    let mut table = format!("pub static BUILTINS: [Builtin; {}] = [\n", patterns.len());
+    for (name, pattern) in patterns {
+        let regex = Builder::new()
+            .dense(dense::Config::new().minimize(true))
+            .build(pattern)
+            .unwrap_or_else(|e| panic!("builtin pattern {name:?}: {e}"));
+
+        let mut paths = Vec::new();
+        for (suffix, dfa) in [("fwd", regex.forward()), ("rev", regex.reverse())] {
+            let (bytes, pad) = if big_endian {
+                dfa.to_bytes_big_endian()
+            } else {
+                dfa.to_bytes_little_endian()
+            };
+            let path = out_dir.join(format!("{name}.{suffix}.dfa"));
+            std::fs::write(&path, &bytes[pad..]).unwrap();
+            paths.push(path);
+        }
+
+        writeln!(
+            table,
+            "    Builtin {{ name: {name:?}, pattern: {pattern:?}, \
+             fwd: &AlignAs {{ _align: [], bytes: *include_bytes!({:?}) }}, \
+             rev: &AlignAs {{ _align: [], bytes: *include_bytes!({:?}) }}, \
+             regex: OnceLock::new() }},",
+            paths[0], paths[1]
+        )
+        .unwrap();
+    }
+    table.push_str("];\n");
+
+    std::fs::write(out_dir.join("builtin.rs"), table).unwrap();
 }
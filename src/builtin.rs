@@ -0,0 +1,38 @@
+//! Patterns compiled to dense DFAs at build time.
+//!
+//! `build.rs` serializes a forward/reverse DFA pair for every builtin pattern
+//! and emits the `BUILTINS` table included below. The state tables live in
+//! the shared library's read-only data; using one only costs a validating
+//! `DFA::from_bytes` on first access, no regex compilation.
+
+use regex_automata::dfa::{dense, regex};
+use regex_automata::util::wire::AlignAs;
+use std::sync::OnceLock;
+
+pub type DenseRegex = regex::Regex<dense::DFA<&'static [u32]>>;
+
+pub struct Builtin {
+    pub name: &'static str,
+    pub pattern: &'static str,
+    fwd: &'static AlignAs<[u8], u32>,
+    rev: &'static AlignAs<[u8], u32>,
+    regex: OnceLock<DenseRegex>,
+}
+
+include!(concat!(env!("OUT_DIR"), "/builtin.rs"));
+
+impl Builtin {
+    pub fn regex(&'static self) -> &'static DenseRegex {
+        self.regex.get_or_init(|| {
+            let (fwd, _) = dense::DFA::from_bytes(&self.fwd.bytes)
+                .expect("builtin forward DFA should be valid");
+            let (rev, _) = dense::DFA::from_bytes(&self.rev.bytes)
+                .expect("builtin reverse DFA should be valid");
+            regex::Builder::new().build_from_dfas(fwd, rev)
+        })
+    }
+}
+
+pub fn lookup(name: &str) -> Option<&'static Builtin> {
+    BUILTINS.iter().find(|builtin| builtin.name == name)
+}
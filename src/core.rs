@@ -1,7 +1,10 @@
+use parking_lot::Mutex;
 use pyo3::Python;
 use pyo3::ffi as pyo3_ffi;
 use pyo3::prelude::*;
 use pyo3::types::PyList;
+use rayon::prelude::*;
+use std::sync::Arc;
 
 // Import the unified debug system
 use crate::debug_println;
@@ -14,20 +17,63 @@ unsafe impl Send for PyObjectPtr {}
 unsafe impl Sync for PyObjectPtr {}
 impl Copy for PyObjectPtr {}
 
+// Buffers of object pointers, such as numpy `object` arrays, use format "O"
+unsafe impl pyo3::buffer::Element for PyObjectPtr {
+    fn is_compatible_format(format: &std::ffi::CStr) -> bool {
+        format.to_bytes() == b"O"
+    }
+}
+
 // Enum for worker results - either pre-converted PyObject or raw Rust type
 #[derive(Debug)]
 pub enum WorkerResult {
     PyObject((usize, PyObjectPtr)),
+    // Input item at this index is the result; needs a refcount bump
+    Reuse(usize),
 }
 
 unsafe impl Send for WorkerResult {}
 
+// What the mapped function produced for one list item
+#[derive(Clone, Copy, Debug)]
+pub enum MapResult {
+    // Newly created object, ownership passes to the list
+    Object(PyObjectPtr),
+    // Result equals the input string, so the input object itself is reused
+    Unchanged,
+}
+
+impl From<PyObjectPtr> for MapResult {
+    #[inline(always)]
+    fn from(ptr: PyObjectPtr) -> Self {
+        MapResult::Object(ptr)
+    }
+}
+
+// New reference to the input item, as an exact `str`. Refcounts are not
+// atomic, so this only runs on the thread holding the GIL.
+unsafe fn reuse_list_item(list_ptr: &PyObjectPtr, index: usize) -> PyObjectPtr {
+    let item = pyo3_ffi::PyList_GET_ITEM(list_ptr.0, index as isize);
+    let obj = pyo3_ffi::PyUnicode_FromObject(item);
+    assert!(!obj.is_null());
+    PyObjectPtr(obj)
+}
+
 // Helper function to safely set list items with PyObjectPtr
 #[inline(always)]
 unsafe fn set_list_item(list_ptr: &PyObjectPtr, index: usize, item_ptr: PyObjectPtr) {
     list_set_item_transfer(list_ptr.0, index as isize, item_ptr.0);
 }
 
+// Inplace store into the caller's list: the old item's reference belonged to
+// the list, so it is released once the slot is overwritten. GIL thread only.
+#[inline(always)]
+unsafe fn replace_list_item(list_ptr: &PyObjectPtr, index: usize, item_ptr: PyObjectPtr) {
+    let old = pyo3_ffi::PyList_GET_ITEM(list_ptr.0, index as isize);
+    set_list_item(list_ptr, index, item_ptr);
+    pyo3_ffi::Py_DECREF(old);
+}
+
 // Bump allocator manager to prevent code duplication
 pub struct BumpAllocatorManager {
     pub name: String,
@@ -85,26 +131,116 @@ fn get_string_at_idx<'a>(list_ptr: &PyObjectPtr, idx: usize, bump: &'a bumpalo::
     }
 }
 
-fn make_range(len: usize, jobs: usize, i: usize) -> (usize, usize) {
+// Borrowed view of one list item handed to the fill functions
+pub trait ListItem {
+    unsafe fn read<'a>(list_ptr: &PyObjectPtr, idx: usize, bump: &'a bumpalo::Bump) -> &'a Self;
+
+    // Cheap size estimate used to size work chunks; 0 for items of the wrong type
+    unsafe fn approx_len(list_ptr: &PyObjectPtr, idx: usize) -> usize;
+}
+
+impl ListItem for str {
+    #[inline(always)]
+    unsafe fn read<'a>(list_ptr: &PyObjectPtr, idx: usize, bump: &'a bumpalo::Bump) -> &'a Self {
+        get_string_at_idx(list_ptr, idx, bump)
+    }
+
+    // Code points, a lower bound on the UTF-8 length
+    unsafe fn approx_len(list_ptr: &PyObjectPtr, idx: usize) -> usize {
+        let str_ptr = pyo3_ffi::PyList_GET_ITEM(list_ptr.0, idx as isize);
+        if pyo3_ffi::PyUnicode_Check(str_ptr) == 0 {
+            return 0;
+        }
+        pyo3_ffi::PyUnicode_GET_LENGTH(str_ptr) as usize
+    }
+}
+
+// `bytes` items are read in place: no copy, no UTF-8 validation
+impl ListItem for [u8] {
+    #[inline(always)]
+    unsafe fn read<'a>(list_ptr: &PyObjectPtr, idx: usize, _bump: &'a bumpalo::Bump) -> &'a Self {
+        let bytes_ptr = pyo3_ffi::PyList_GET_ITEM(list_ptr.0, idx as isize);
+        assert!(!bytes_ptr.is_null());
+        assert!(pyo3_ffi::PyBytes_Check(bytes_ptr) != 0);
+        let data = pyo3_ffi::PyBytes_AsString(bytes_ptr) as *const u8;
+        let len = pyo3_ffi::PyBytes_Size(bytes_ptr) as usize;
+        std::slice::from_raw_parts(data, len)
+    }
+
+    unsafe fn approx_len(list_ptr: &PyObjectPtr, idx: usize) -> usize {
+        let bytes_ptr = pyo3_ffi::PyList_GET_ITEM(list_ptr.0, idx as isize);
+        if pyo3_ffi::PyBytes_Check(bytes_ptr) == 0 {
+            return 0;
+        }
+        pyo3_ffi::PyBytes_Size(bytes_ptr) as usize
+    }
+}
+
+// Several chunks per worker, so idle threads can steal the tail of a slow
+// worker's share instead of waiting on it at the end
+const CHUNKS_PER_JOB: usize = 8;
+
+// ...but no smaller than about an L2 cache worth of input: every chunk pays
+// for a fresh matcher clone and bump arena, which tiny chunks never amortize.
+// The minimum wins over an explicit `jobs`: an input under `jobs` times this
+// runs on fewer workers, one for anything under 256 KB
+const MIN_CHUNK_BYTES: usize = 256 * 1024;
+const LENGTH_SAMPLES: usize = 64;
+
+// Items per chunk. Runs on the GIL thread, before workers start.
+fn chunk_size<S: ListItem + ?Sized>(list_ptr: &PyObjectPtr, len: usize, jobs: usize) -> usize {
     assert!(jobs > 0, "jobs must be > 0");
-    assert!(
-        i < jobs,
-        "thread index {} is out of range (jobs = {})",
-        i,
-        jobs
-    );
+    let by_jobs = len / (jobs * CHUNKS_PER_JOB);
+    let by_bytes = MIN_CHUNK_BYTES / average_item_len::<S>(list_ptr, len).max(1);
+    by_jobs.max(by_bytes).max(1)
+}
+
+// Mean size of up to `LENGTH_SAMPLES` evenly spaced items
+fn average_item_len<S: ListItem + ?Sized>(list_ptr: &PyObjectPtr, len: usize) -> usize {
+    if len == 0 {
+        return 0;
+    }
+    let step = len.div_ceil(LENGTH_SAMPLES);
+    let (total, count) = (0..len)
+        .step_by(step)
+        .map(|idx| unsafe { S::approx_len(list_ptr, idx) })
+        .fold((0, 0), |(total, count), item_len| (total + item_len, count + 1));
+    total / count
+}
+
+fn build_pool(jobs: usize) -> rayon::ThreadPool {
+    rayon::ThreadPoolBuilder::new()
+        .num_threads(jobs)
+        .thread_name(|t| format!("worker_{}", t))
+        .start_handler(|_t| {
+            debug_println!("worker_{} init", _t);
+        })
+        .exit_handler(|_t| {
+            debug_println!("worker_{} exit", _t);
+        })
+        .build()
+        .unwrap()
+}
 
-    let base = len / jobs;
-    let rem = len % jobs;
+// Spawning threads costs more than a short call, keep one pool per size
+static POOLS: Mutex<Vec<(usize, Arc<rayon::ThreadPool>)>> = Mutex::new(Vec::new());
 
-    // Distribute the remainder to the first `rem` jobs
-    let start = i * base + i.min(rem);
-    let end = start + base + if i < rem { 1 } else { 0 };
+fn get_pool(jobs: usize) -> Arc<rayon::ThreadPool> {
+    let mut pools = POOLS.lock();
+    if let Some((_, pool)) = pools.iter().find(|(size, _)| *size == jobs) {
+        return pool.clone();
+    }
+
+    let pool = Arc::new(build_pool(jobs));
+    pools.push((jobs, pool.clone()));
+    pool
+}
 
-    (start, end)
+fn worker_name() -> String {
+    format!("Thread {}", rayon::current_thread_index().unwrap_or(0))
 }
 
-fn map_pylist_parallel<'py, F1, F2>(
+fn map_pylist_parallel<'py, F1, F2, R>(
     py: Python<'py>,
     list: &Bound<'py, PyList>,
     jobs: usize,
@@ -113,12 +249,13 @@ fn map_pylist_parallel<'py, F1, F2>(
 ) -> PyResult<PyObject>
 where
     F1: Fn() -> F2 + Send + Sync,
-    F2: for<'a> Fn(&'a str) -> PyObjectPtr + Send + 'static,
+    F2: for<'a> Fn(&'a str) -> R + Send + 'static,
+    R: Into<MapResult>,
 {
     let list_len = list.len();
     let input_list_ptr = PyObjectPtr(list.as_ptr());
 
-    let real_jobs = jobs.min(list_len);
+    let real_jobs = jobs.min(list_len).max(1);
     debug_println!("parallel processing: jobs {}", real_jobs);
 
     // Create result list or use input list
@@ -132,77 +269,64 @@ where
         }
     };
 
-    // Setup threading pool
-    let pool = rayon::ThreadPoolBuilder::new()
-        .num_threads(real_jobs)
-        .thread_name(|t| format!("worker_{}", t))
-        .start_handler(|_t| {
-            debug_println!("worker_{} init", _t);
-        })
-        .exit_handler(|_t| {
-            debug_println!("worker_{} exit", _t);
-        })
-        .build()
-        .unwrap();
+    let pool = get_pool(real_jobs);
+    let chunk = chunk_size::<str>(&input_list_ptr, list_len, real_jobs);
 
     // Create channel for streaming results from workers to main thread
     let (sender, receiver) = crossbeam_channel::unbounded::<WorkerResult>();
 
-    for job_idx in 0..real_jobs {
-        let (range_start, range_stop) = make_range(list_len, real_jobs, job_idx);
-        let input_list_ptr = input_list_ptr.clone();
-        let sender = sender.clone();
-
-        let func = make_func();
-        pool.spawn(move || {
-            debug_println!(
-                "thread {} started, range {}, {}",
-                job_idx,
-                range_start,
-                range_stop
-            );
-
-            // Pre-allocate bump arena for this thread
-            let mut bump_manager = BumpAllocatorManager::new(format!("Thread {}", job_idx));
-
-            for i in range_start..range_stop {
-                // Extract string from input list
-                let bump_string = get_string_at_idx(&input_list_ptr, i, bump_manager.bump());
-
-                let py_obj = func(bump_string);
-                if inplace {
-                    sender.send(WorkerResult::PyObject((i, py_obj))).unwrap();
-                } else {
-                    unsafe { set_list_item(&target_list_ptr, i, py_obj) };
-                }
-
-                if (i - range_start) % MANAGEMENT_BATCH_SIZE == 0 {
-                    bump_manager.manage_memory();
-                }
-            }
-
-            debug_println!(
-                "Thread {} finished, final arena size: {}MB",
-                job_idx,
-                bump_manager.bump().allocated_bytes() / 1024 / 1024
+    // The GIL stays with this thread for the whole call: workers read borrowed
+    // items of `list`, which other Python threads could otherwise mutate or free
+    pool.in_place_scope(|scope| {
+        let make_func = &make_func;
+
+        scope.spawn(move |_| {
+            (0..list_len).into_par_iter().with_min_len(chunk).for_each_init(
+                || {
+                    // One matcher and arena per rayon split, reused across its items
+                    let bump_manager = BumpAllocatorManager::new(worker_name());
+                    (make_func(), bump_manager, sender.clone(), 0usize)
+                },
+                |(func, bump_manager, sender, processed), i| {
+                    // Extract string from input list
+                    let bump_string = get_string_at_idx(&input_list_ptr, i, bump_manager.bump());
+
+                    match func(bump_string).into() {
+                        MapResult::Object(py_obj) if inplace => {
+                            sender.send(WorkerResult::PyObject((i, py_obj))).unwrap();
+                        }
+                        MapResult::Object(py_obj) => unsafe {
+                            set_list_item(&target_list_ptr, i, py_obj)
+                        },
+                        // Inplace: the item is already there
+                        MapResult::Unchanged if inplace => {}
+                        MapResult::Unchanged => {
+                            sender.send(WorkerResult::Reuse(i)).unwrap();
+                        }
+                    }
+
+                    *processed += 1;
+                    if *processed % MANAGEMENT_BATCH_SIZE == 0 {
+                        bump_manager.manage_memory();
+                    }
+                },
             );
         });
-    }
 
-    // Close sender side to signal when all workers are done
-    drop(sender);
-
-    // Main thread: apply results as they arrive (streaming updates)
-    for result in receiver {
-        match result {
-            WorkerResult::PyObject((index, py_obj)) => {
-                // Pre-converted in worker thread - just set
-                unsafe {
+        // Main thread: apply results as they arrive (streaming updates). Only
+        // inplace runs send objects here, the worker is done with that item
+        for result in receiver {
+            match result {
+                WorkerResult::PyObject((index, py_obj)) => unsafe {
+                    replace_list_item(&target_list_ptr, index, py_obj);
+                },
+                WorkerResult::Reuse(index) => unsafe {
+                    let py_obj = reuse_list_item(&input_list_ptr, index);
                     set_list_item(&target_list_ptr, index, py_obj);
-                }
+                },
             }
         }
-    }
+    });
 
     debug_println!("Passed the barrier");
 
@@ -214,7 +338,7 @@ where
 }
 
 // Sequential processing for jobs=1 or fallback
-fn map_pylist_sequential<'py, F1, F2>(
+fn map_pylist_sequential<'py, F1, F2, R>(
     py: Python<'py>,
     list: &Bound<'py, PyList>,
     inplace: bool,
@@ -222,7 +346,8 @@ fn map_pylist_sequential<'py, F1, F2>(
 ) -> PyResult<PyObject>
 where
     F1: Fn() -> F2,
-    F2: for<'a> Fn(&'a str) -> PyObjectPtr,
+    F2: for<'a> Fn(&'a str) -> R,
+    R: Into<MapResult>,
 {
     let list_len = list.len();
     let input_list_ptr = PyObjectPtr(list.as_ptr());
@@ -237,10 +362,10 @@ where
         // Modify existing list in place
         for i in 0..list_len {
             let bump_string = get_string_at_idx(&input_list_ptr, i, bump_manager.bump());
-            let py_obj = func(bump_string);
-
-            unsafe {
-                set_list_item(&input_list_ptr, i, py_obj);
+            if let MapResult::Object(py_obj) = func(bump_string).into() {
+                unsafe {
+                    replace_list_item(&input_list_ptr, i, py_obj);
+                }
             }
 
             if i % MANAGEMENT_BATCH_SIZE == 0 {
@@ -257,7 +382,10 @@ where
 
             for i in 0..list_len {
                 let bump_string = get_string_at_idx(&input_list_ptr, i, bump_manager.bump());
-                let py_obj = func(bump_string);
+                let py_obj = match func(bump_string).into() {
+                    MapResult::Object(py_obj) => py_obj,
+                    MapResult::Unchanged => reuse_list_item(&input_list_ptr, i),
+                };
                 set_list_item(&result_list_ptr, i, py_obj);
 
                 if i % MANAGEMENT_BATCH_SIZE == 0 {
@@ -271,7 +399,7 @@ where
 }
 
 // Main entry point - simplified to just sequential vs parallel
-pub fn map_pylist<'py, F1, F2>(
+pub fn map_pylist<'py, F1, F2, R>(
     py: Python<'py>,
     list: &Bound<'py, PyList>,
     jobs: usize,
@@ -280,7 +408,8 @@ pub fn map_pylist<'py, F1, F2>(
 ) -> PyResult<PyObject>
 where
     F1: Fn() -> F2 + Send + Sync,
-    F2: for<'a> Fn(&'a str) -> PyObjectPtr + Send + 'static,
+    F2: for<'a> Fn(&'a str) -> R + Send + 'static,
+    R: Into<MapResult>,
 {
     if jobs == 1 {
         map_pylist_sequential(py, list, inplace, make_func)
@@ -288,3 +417,82 @@ where
         map_pylist_parallel(py, list, jobs, inplace, make_func)
     }
 }
+
+// Fill `out[i]` with `func(list[i])` - plain Rust values, no Python objects.
+// Every worker owns a disjoint slice of `out`, so no channel is needed.
+pub fn fill_from_pylist<'py, S, T, F1, F2>(
+    py: Python<'py>,
+    list: &Bound<'py, PyList>,
+    jobs: usize,
+    out: &mut [T],
+    make_func: F1,
+) where
+    S: ListItem + ?Sized,
+    T: Send,
+    F1: Fn() -> F2 + Send + Sync,
+    F2: for<'a> Fn(&'a S) -> T + Send,
+{
+    let make_row_func = || {
+        let func = make_func();
+        move |s: &S, row: &mut [T]| row[0] = func(s)
+    };
+
+    fill_rows_from_pylist(py, list, jobs, 1, out, make_row_func)
+}
+
+// Same as `fill_from_pylist` with `width` output slots per item:
+// `func(list[i], &mut out[i * width..(i + 1) * width])`
+pub fn fill_rows_from_pylist<'py, S, T, F1, F2>(
+    _py: Python<'py>,
+    list: &Bound<'py, PyList>,
+    jobs: usize,
+    width: usize,
+    out: &mut [T],
+    make_func: F1,
+) where
+    S: ListItem + ?Sized,
+    T: Send,
+    F1: Fn() -> F2 + Send + Sync,
+    F2: for<'a> Fn(&'a S, &mut [T]) + Send,
+{
+    let list_len = list.len();
+    assert!(width > 0, "width must be > 0");
+    assert_eq!(
+        out.len(),
+        list_len * width,
+        "output length must match list length"
+    );
+    let input_list_ptr = PyObjectPtr(list.as_ptr());
+
+    let fill = |range_start: usize, slots: &mut [T], func: &F2, bump_manager: &mut BumpAllocatorManager| {
+        for (offset, row) in slots.chunks_mut(width).enumerate() {
+            let item = unsafe { S::read(&input_list_ptr, range_start + offset, bump_manager.bump()) };
+            func(item, row);
+
+            if offset % MANAGEMENT_BATCH_SIZE == 0 {
+                bump_manager.manage_memory();
+            }
+        }
+    };
+
+    let real_jobs = jobs.min(list_len);
+    if real_jobs <= 1 {
+        debug_println!("sequential fill, list length {}", list_len);
+        let mut bump_manager = BumpAllocatorManager::new("Sequential".to_string());
+        fill(0, out, &make_func(), &mut bump_manager);
+        return;
+    }
+
+    debug_println!("parallel fill: jobs {}", real_jobs);
+    let pool = get_pool(real_jobs);
+    let chunk = chunk_size::<S>(&input_list_ptr, list_len, real_jobs);
+
+    pool.install(|| {
+        out.par_chunks_mut(chunk * width).enumerate().for_each_init(
+            || (make_func(), BumpAllocatorManager::new(worker_name())),
+            |(func, bump_manager), (chunk_idx, slots)| {
+                fill(chunk_idx * chunk, slots, func, bump_manager)
+            },
+        );
+    });
+}
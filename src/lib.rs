@@ -3,10 +3,19 @@
 #![feature(min_specialization)]
 
 use crate::converter::ToPyObject;
+use crate::core::MapResult;
+use crate::pattern::Pattern;
+use aho_corasick::AhoCorasick;
 use mimalloc::MiMalloc;
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyList, PyString};
-use regex::RegexBuilder;
+use pyo3::types::{PyBytes, PyList, PyString};
+use regex::Regex;
+use std::borrow::Cow;
+use std::cell::RefCell;
+use std::ops::Range;
+use std::sync::Arc;
 
 // Let's globaly use mimmaloc as allocator
 #[global_allocator]
@@ -26,9 +35,11 @@ macro_rules! debug_println {
 // Export the macro so it can be used in other modules
 pub(crate) use debug_println;
 
+pub mod builtin;
 pub mod converter;
 pub mod core;
 pub mod object;
+pub mod pattern;
 pub mod simd;
 pub mod text;
 
@@ -40,25 +51,109 @@ mod yurki {
     mod internal {
         use super::*;
 
+        /// Regex compiled once on the Rust side and reusable across calls.
+        #[pyclass(frozen, module = "yurki.internal")]
+        struct CompiledRegex {
+            pattern: Pattern,
+        }
+
+        #[pymethods]
+        impl CompiledRegex {
+            #[new]
+            #[pyo3(signature = (pattern, case = false))]
+            fn new(pattern: &str, case: bool) -> PyResult<Self> {
+                let pattern = build_pattern(pattern, case)?;
+                Ok(Self { pattern })
+            }
+
+            #[getter]
+            fn pattern(&self) -> &str {
+                self.pattern.as_str()
+            }
+
+            #[getter]
+            fn case(&self) -> bool {
+                self.pattern.case()
+            }
+
+            fn __repr__(&self) -> String {
+                format!(
+                    "CompiledRegex({:?}, case={})",
+                    self.pattern.as_str(),
+                    if self.pattern.case() { "True" } else { "False" }
+                )
+            }
+        }
+
+        fn build_pattern(pattern: &str, case: bool) -> PyResult<Pattern> {
+            Pattern::new(pattern, case).map_err(|e| match e.syntax_error() {
+                Some(err) => PyValueError::new_err(err.to_string()),
+                None => PyValueError::new_err(e.to_string()),
+            })
+        }
+
+        // Accept either a raw pattern string or a `CompiledRegex` handle.
+        // Compiled handles carry their own flags, like `re.compile` objects.
+        fn resolve_pattern(pattern: &Bound<PyAny>, case: bool) -> PyResult<Pattern> {
+            if let Ok(compiled) = pattern.downcast::<CompiledRegex>() {
+                if case {
+                    return Err(PyValueError::new_err(
+                        "cannot process case argument with a compiled pattern",
+                    ));
+                }
+                return Ok(compiled.get().pattern.clone());
+            }
+
+            let pattern = pattern.downcast::<PyString>()?;
+            build_pattern(&pattern.to_cow()?, case)
+        }
+
+        /// Look up a pattern embedded as a dense DFA at build time.
+        #[pyfunction]
+        fn precompiled_regex(name: &str) -> PyResult<CompiledRegex> {
+            match Pattern::builtin(name) {
+                Some(pattern) => Ok(CompiledRegex { pattern }),
+                None => Err(PyValueError::new_err(format!(
+                    "unknown precompiled pattern: {name:?}"
+                ))),
+            }
+        }
+
+        fn capture_regex(pattern: &Pattern) -> PyResult<Regex> {
+            pattern
+                .regex()
+                .cloned()
+                .map_err(|e| PyValueError::new_err(e.to_string()))
+        }
+
         #[pyfunction]
         fn find_regex_in_string(
             py: Python,
             list: &Bound<PyList>,
-            pattern: &Bound<PyString>,
+            pattern: &Bound<PyAny>,
             case: bool,
             jobs: usize,
             inplace: bool,
         ) -> PyResult<PyObject> {
-            let pattern = RegexBuilder::new(&pattern.to_string())
-                .case_insensitive(case)
-                .build()
-                .unwrap();
+            let pattern = resolve_pattern(pattern, case)?;
+            let matcher = pattern.matcher().clone();
+            let prefilter = pattern.prefilter().clone();
 
-            let make_func = {
-                let pattern = pattern.clone();
-                move || unsafe {
-                    let pattern = pattern.clone();
-                    move |s: &str| text::find_in_string(s, &pattern).to_py_object()
+            let make_func = move || unsafe {
+                let matcher = matcher.clone();
+                let prefilter = prefilter.clone();
+                move |s: &str| {
+                    let found = if prefilter.may_match(s) {
+                        text::find_in_string(s, &matcher)
+                    } else {
+                        Cow::Borrowed("")
+                    };
+                    // A match over the whole input is the input object itself
+                    if found.len() == s.len() {
+                        MapResult::Unchanged
+                    } else {
+                        MapResult::Object(found.to_py_object())
+                    }
                 }
             };
 
@@ -66,98 +161,576 @@ mod yurki {
             Ok(list)
         }
 
+        /// `find` results written into a caller-provided buffer of object
+        /// pointers, such as a numpy `object` array, instead of a new list.
+        #[pyfunction]
+        fn find_regex_into(
+            py: Python,
+            list: &Bound<PyList>,
+            pattern: &Bound<PyAny>,
+            out: &Bound<PyAny>,
+            case: bool,
+            jobs: usize,
+        ) -> PyResult<()> {
+            let pattern = resolve_pattern(pattern, case)?;
+            let matcher = pattern.matcher().clone();
+            let prefilter = pattern.prefilter().clone();
+
+            let buffer = PyBuffer::<core::PyObjectPtr>::get(out).map_err(|_| {
+                PyTypeError::new_err("output must be a buffer of objects, such as a numpy object array")
+            })?;
+            check_buffer(&buffer, list.len())?;
+
+            let make_func = move || {
+                let matcher = matcher.clone();
+                let prefilter = prefilter.clone();
+                move |s: &str| unsafe {
+                    let found = if prefilter.may_match(s) {
+                        text::find_in_string(s, &matcher)
+                    } else {
+                        Cow::Borrowed("")
+                    };
+                    // Null marks a whole-input match, filled in with the input below
+                    if found.len() == s.len() {
+                        core::PyObjectPtr(std::ptr::null_mut())
+                    } else {
+                        found.to_py_object()
+                    }
+                }
+            };
+
+            let mut found = vec![core::PyObjectPtr(std::ptr::null_mut()); list.len()];
+            core::fill_from_pylist(py, list, jobs, &mut found, make_func);
+
+            // The GIL is held throughout, so nothing else touches the buffer
+            let slots = unsafe {
+                std::slice::from_raw_parts_mut(buffer.buf_ptr() as *mut core::PyObjectPtr, list.len())
+            };
+            for (index, (slot, item)) in slots.iter_mut().zip(found).enumerate() {
+                unsafe {
+                    let item = if item.0.is_null() {
+                        let input = pyo3::ffi::PyList_GET_ITEM(list.as_ptr(), index as isize);
+                        let item = pyo3::ffi::PyUnicode_FromObject(input);
+                        assert!(!item.is_null());
+                        item
+                    } else {
+                        item.0
+                    };
+                    // The buffer owned its old items, `None` in a fresh `numpy.empty`
+                    pyo3::ffi::Py_XDECREF(std::mem::replace(&mut slot.0, item));
+                }
+            }
+            Ok(())
+        }
+
+        fn bytes_regex(pattern: &Pattern) -> PyResult<regex::bytes::Regex> {
+            pattern
+                .bytes_regex()
+                .cloned()
+                .map_err(|e| PyValueError::new_err(e.to_string()))
+        }
+
+        // New reference to `item[range]`; a range over the whole of an exact
+        // `bytes` object is the object itself. GIL thread only.
+        unsafe fn bytes_slice(
+            item: *mut pyo3::ffi::PyObject,
+            range: std::ops::Range<usize>,
+        ) -> *mut pyo3::ffi::PyObject {
+            let len = pyo3::ffi::PyBytes_Size(item) as usize;
+            let slice = if range.len() == len && pyo3::ffi::PyBytes_CheckExact(item) != 0 {
+                pyo3::ffi::Py_INCREF(item);
+                item
+            } else {
+                let data = pyo3::ffi::PyBytes_AsString(item);
+                pyo3::ffi::PyBytes_FromStringAndSize(
+                    data.add(range.start),
+                    range.len() as pyo3::ffi::Py_ssize_t,
+                )
+            };
+            assert!(!slice.is_null());
+            slice
+        }
+
+        // Result list of `build(list[i], rows[i])` for every row, built on the GIL thread
+        unsafe fn bytes_list<T>(
+            py: Python,
+            list: &Bound<PyList>,
+            rows: Vec<T>,
+            build: impl Fn(*mut pyo3::ffi::PyObject, T) -> *mut pyo3::ffi::PyObject,
+        ) -> PyObject {
+            let result = object::create_list_empty(rows.len() as isize);
+            assert!(!result.is_null());
+
+            for (index, row) in rows.into_iter().enumerate() {
+                let item = pyo3::ffi::PyList_GET_ITEM(list.as_ptr(), index as isize);
+                object::list_set_item_transfer(result, index as isize, build(item, row));
+            }
+
+            Py::from_owned_ptr(py, result)
+        }
+
+        /// `find` over `bytes` items, with a byte-oriented regex.
+        #[pyfunction]
+        fn find_regex_in_bytes(
+            py: Python,
+            list: &Bound<PyList>,
+            pattern: &Bound<PyAny>,
+            case: bool,
+            jobs: usize,
+        ) -> PyResult<PyObject> {
+            let regex = bytes_regex(&resolve_pattern(pattern, case)?)?;
+
+            // Workers only locate matches; `bytes` objects can't be created off the GIL
+            let mut spans = vec![None; list.len()];
+            let make_func = move || {
+                let regex = regex.clone();
+                move |s: &[u8]| regex.find(s).map(|m| m.range())
+            };
+            core::fill_from_pylist(py, list, jobs, &mut spans, make_func);
+
+            unsafe {
+                Ok(bytes_list(py, list, spans, |item, span| {
+                    bytes_slice(item, span.unwrap_or(0..0))
+                }))
+            }
+        }
+
+        /// `split` over `bytes` items, with a byte-oriented regex.
+        #[pyfunction]
+        fn split_by_regexp_bytes(
+            py: Python,
+            list: &Bound<PyList>,
+            pattern: &Bound<PyAny>,
+            case: bool,
+            jobs: usize,
+        ) -> PyResult<PyObject> {
+            let regex = bytes_regex(&resolve_pattern(pattern, case)?)?;
+
+            let mut parts = vec![Vec::new(); list.len()];
+            let make_func = move || {
+                let regex = regex.clone();
+                move |s: &[u8]| text::split_by_regexp_bytes(s, &regex)
+            };
+            core::fill_from_pylist(py, list, jobs, &mut parts, make_func);
+
+            unsafe {
+                Ok(bytes_list(py, list, parts, |item, ranges| {
+                    let row = object::create_list_empty(ranges.len() as isize);
+                    assert!(!row.is_null());
+                    for (index, range) in ranges.into_iter().enumerate() {
+                        object::list_set_item_transfer(row, index as isize, bytes_slice(item, range));
+                    }
+                    row
+                }))
+            }
+        }
+
+        /// `replace` over `bytes` items, with a byte-oriented regex.
+        #[pyfunction]
+        fn replace_regexp_in_bytes(
+            py: Python,
+            list: &Bound<PyList>,
+            pattern: &Bound<PyAny>,
+            replacement: &[u8],
+            count: usize,
+            case: bool,
+            jobs: usize,
+        ) -> PyResult<PyObject> {
+            let regex = bytes_regex(&resolve_pattern(pattern, case)?)?;
+            let replacement = replacement.to_vec();
+
+            let mut replaced = vec![None; list.len()];
+            let make_func = move || {
+                let regex = regex.clone();
+                let replacement = replacement.clone();
+                move |s: &[u8]| text::replace_regexp_in_bytes(s, &regex, &replacement, count)
+            };
+            core::fill_from_pylist(py, list, jobs, &mut replaced, make_func);
+
+            unsafe {
+                Ok(bytes_list(py, list, replaced, |item, replaced| match replaced {
+                    Some(out) => {
+                        let out = pyo3::ffi::PyBytes_FromStringAndSize(
+                            out.as_ptr() as *const std::os::raw::c_char,
+                            out.len() as pyo3::ffi::Py_ssize_t,
+                        );
+                        assert!(!out.is_null());
+                        out
+                    }
+                    // Unchanged: the input itself, as an exact `bytes`
+                    None => bytes_slice(item, 0..pyo3::ffi::PyBytes_Size(item) as usize),
+                }))
+            }
+        }
+
         #[pyfunction]
         fn is_match_regex_in_string(
             py: Python,
             list: &Bound<PyList>,
-            pattern: &Bound<PyString>,
+            pattern: &Bound<PyAny>,
             case: bool,
             jobs: usize,
             inplace: bool,
         ) -> PyResult<PyObject> {
-            let pattern = RegexBuilder::new(&pattern.to_string())
-                .case_insensitive(case)
-                .build()
-                .unwrap();
+            let pattern = resolve_pattern(pattern, case)?;
+            let matcher = pattern.matcher().clone();
+            let prefilter = pattern.prefilter().clone();
 
             let make_func = move || unsafe {
-                let pattern = pattern.clone();
-                move |s: &str| text::is_match_in_string(s, &pattern).to_py_object()
+                let matcher = matcher.clone();
+                let prefilter = prefilter.clone();
+                move |s: &str| {
+                    (prefilter.may_match(s) && text::is_match_in_string(s, &matcher)).to_py_object()
+                }
             };
 
             let list = core::map_pylist(py, list, jobs, inplace, make_func)?;
             Ok(list)
         }
 
+        /// Match flags as `bytes`: one 0/1 byte per input string.
+        #[pyfunction]
+        fn is_match_regex_bytes(
+            py: Python,
+            list: &Bound<PyList>,
+            pattern: &Bound<PyAny>,
+            case: bool,
+            jobs: usize,
+        ) -> PyResult<Py<PyBytes>> {
+            let pattern = resolve_pattern(pattern, case)?;
+            let matcher = pattern.matcher().clone();
+            let prefilter = pattern.prefilter().clone();
+
+            let make_func = move || {
+                let matcher = matcher.clone();
+                let prefilter = prefilter.clone();
+                move |s: &str| (prefilter.may_match(s) && text::is_match_in_string(s, &matcher)) as u8
+            };
+
+            let mask = PyBytes::new_with(py, list.len(), |out| {
+                core::fill_from_pylist(py, list, jobs, out, make_func);
+                Ok(())
+            })?;
+            Ok(mask.unbind())
+        }
+
+        /// Write match flags into a caller-provided one-byte-per-item buffer.
+        #[pyfunction]
+        fn is_match_regex_into(
+            py: Python,
+            list: &Bound<PyList>,
+            pattern: &Bound<PyAny>,
+            out: &Bound<PyAny>,
+            case: bool,
+            jobs: usize,
+        ) -> PyResult<()> {
+            let pattern = resolve_pattern(pattern, case)?;
+            let matcher = pattern.matcher().clone();
+            let prefilter = pattern.prefilter().clone();
+
+            let make_func = move || {
+                let matcher = matcher.clone();
+                let prefilter = prefilter.clone();
+                move |s: &str| (prefilter.may_match(s) && text::is_match_in_string(s, &matcher)) as u8
+            };
+            let fill = |out: &mut [u8]| core::fill_from_pylist(py, list, jobs, out, make_func);
+
+            // array('B'), bytearray and uint8 arrays; array('b') and int8; numpy bool
+            if let Ok(buffer) = PyBuffer::<u8>::get(out) {
+                write_mask(&buffer, list.len(), fill)
+            } else if let Ok(buffer) = PyBuffer::<i8>::get(out) {
+                write_mask(&buffer, list.len(), fill)
+            } else if let Ok(buffer) = PyBuffer::<bool>::get(out) {
+                write_mask(&buffer, list.len(), fill)
+            } else {
+                Err(PyTypeError::new_err(
+                    "output must be a buffer of one-byte integers or bools",
+                ))
+            }
+        }
+
+        // Every accepted element type is one byte wide, and 0/1 is valid for all
+        fn write_mask<T: Element>(
+            buffer: &PyBuffer<T>,
+            len: usize,
+            fill: impl FnOnce(&mut [u8]),
+        ) -> PyResult<()> {
+            check_buffer(buffer, len)?;
+
+            // The GIL is held until `fill` returns, so nothing else writes the buffer
+            let out =
+                unsafe { std::slice::from_raw_parts_mut(buffer.buf_ptr() as *mut u8, len) };
+            fill(out);
+            Ok(())
+        }
+
+        // Output buffers are written in place as one flat run of `len` items
+        fn check_buffer<T: Element>(buffer: &PyBuffer<T>, len: usize) -> PyResult<()> {
+            if buffer.readonly() {
+                return Err(PyTypeError::new_err("output buffer is read-only"));
+            }
+            if !buffer.is_c_contiguous() {
+                return Err(PyValueError::new_err("output buffer must be C-contiguous"));
+            }
+            if buffer.item_count() != len {
+                return Err(PyValueError::new_err(format!(
+                    "output buffer has {} items, expected {}",
+                    buffer.item_count(),
+                    len
+                )));
+            }
+            Ok(())
+        }
+
         #[pyfunction]
         fn capture_regex_in_string(
             py: Python,
             list: &Bound<PyList>,
-            pattern: &Bound<PyString>,
+            pattern: &Bound<PyAny>,
             case: bool,
             jobs: usize,
             inplace: bool,
         ) -> PyResult<PyObject> {
-            let pattern = RegexBuilder::new(&pattern.to_string())
-                .case_insensitive(case)
-                .build()
-                .unwrap();
+            let pattern = resolve_pattern(pattern, case)?;
+            let prefilter = pattern.prefilter().clone();
+            let pattern = capture_regex(&pattern)?;
 
             let make_func = move || unsafe {
                 let pattern = pattern.clone();
-                move |s: &str| text::capture_regex_in_string(s, &pattern).to_py_object()
+                let prefilter = prefilter.clone();
+                let locs = RefCell::new(pattern.capture_locations());
+                move |s: &str| {
+                    if !prefilter.may_match(s) {
+                        return Vec::<Cow<str>>::new().to_py_object();
+                    }
+                    let mut locs = locs.borrow_mut();
+                    text::capture_regex_in_string(s, &pattern, &mut locs).to_py_object()
+                }
             };
 
             let list = core::map_pylist(py, list, jobs, inplace, make_func)?;
             Ok(list)
         }
 
+        /// Captured groups of all strings in one flat list, plus row offsets:
+        /// the groups of string `i` are `values[offsets[i]..offsets[i + 1]]`.
+        #[pyfunction]
+        fn capture_regex_in_string_flat(
+            py: Python,
+            list: &Bound<PyList>,
+            pattern: &Bound<PyAny>,
+            case: bool,
+            jobs: usize,
+        ) -> PyResult<(Py<PyList>, PyObject)> {
+            let pattern = resolve_pattern(pattern, case)?;
+            let prefilter = pattern.prefilter().clone();
+            let pattern = capture_regex(&pattern)?;
+            let width = pattern.captures_len();
+
+            // One row of `width` slots per string, left null when it doesn't match
+            let mut slots = vec![core::PyObjectPtr(std::ptr::null_mut()); list.len() * width];
+
+            let make_func = move || {
+                let pattern = pattern.clone();
+                let prefilter = prefilter.clone();
+                let locs = RefCell::new(pattern.capture_locations());
+                move |s: &str, row: &mut [core::PyObjectPtr]| unsafe {
+                    if !prefilter.may_match(s) {
+                        return;
+                    }
+                    let mut locs = locs.borrow_mut();
+                    let groups = text::capture_regex_in_string(s, &pattern, &mut locs);
+                    for (slot, group) in row.iter_mut().zip(groups) {
+                        *slot = group.to_py_object();
+                    }
+                }
+            };
+
+            core::fill_rows_from_pylist(py, list, jobs, width, &mut slots, make_func);
+
+            let mut offsets = Vec::with_capacity(list.len() + 1);
+            let mut total = 0;
+            offsets.push(total);
+            for row in slots.chunks(width) {
+                if !row[0].0.is_null() {
+                    total += width;
+                }
+                offsets.push(total);
+            }
+
+            let values = unsafe {
+                let values = object::create_list_empty(total as isize);
+                assert!(!values.is_null());
+                let matched = slots.iter().filter(|slot| !slot.0.is_null());
+                for (index, slot) in matched.enumerate() {
+                    object::list_set_item_transfer(values, index as isize, slot.0);
+                }
+                Py::from_owned_ptr(py, values)
+            };
+
+            Ok((PyList::new(py, offsets)?.unbind(), values))
+        }
+
+        /// Captured groups as one list per group: `columns[j][i]` is group `j`
+        /// of string `i`, `""` when the group or the whole pattern didn't match.
+        #[pyfunction]
+        fn capture_regex_in_string_columns(
+            py: Python,
+            list: &Bound<PyList>,
+            pattern: &Bound<PyAny>,
+            case: bool,
+            jobs: usize,
+        ) -> PyResult<Py<PyList>> {
+            let pattern = resolve_pattern(pattern, case)?;
+            let prefilter = pattern.prefilter().clone();
+            let pattern = capture_regex(&pattern)?;
+            let width = pattern.captures_len();
+            let len = list.len();
+
+            // Same row-major slot matrix as `capture_regex_in_string_flat`
+            let mut slots = vec![core::PyObjectPtr(std::ptr::null_mut()); len * width];
+
+            let make_func = move || {
+                let pattern = pattern.clone();
+                let prefilter = prefilter.clone();
+                let locs = RefCell::new(pattern.capture_locations());
+                move |s: &str, row: &mut [core::PyObjectPtr]| unsafe {
+                    if !prefilter.may_match(s) {
+                        return;
+                    }
+                    let mut locs = locs.borrow_mut();
+                    let groups = text::capture_regex_in_string(s, &pattern, &mut locs);
+                    for (slot, group) in row.iter_mut().zip(groups) {
+                        *slot = group.to_py_object();
+                    }
+                }
+            };
+
+            core::fill_rows_from_pylist(py, list, jobs, width, &mut slots, make_func);
+
+            // Transposing only moves pointers; rows without a match share the
+            // immortal empty string
+            let columns = (0..width).map(|group| unsafe {
+                let column = object::create_list_empty(len as isize);
+                assert!(!column.is_null());
+                for (index, row) in slots.chunks(width).enumerate() {
+                    let slot = row[group];
+                    let item = if slot.0.is_null() { "".to_py_object() } else { slot };
+                    object::list_set_item_transfer(column, index as isize, item.0);
+                }
+                PyObject::from_owned_ptr(py, column)
+            });
+
+            Ok(PyList::new(py, columns)?.unbind())
+        }
+
         #[pyfunction]
         fn split_by_regexp_string(
             py: Python,
             list: &Bound<PyList>,
-            pattern: &Bound<PyString>,
+            pattern: &Bound<PyAny>,
             case: bool,
             jobs: usize,
             inplace: bool,
         ) -> PyResult<PyObject> {
-            let pattern = RegexBuilder::new(&pattern.to_string())
-                .case_insensitive(case)
-                .build()
-                .unwrap();
+            let pattern = resolve_pattern(pattern, case)?;
+
+            // Single literals and small ASCII sets (`,`, `[,;]`, `\t`) split on memchr
+            if let Some(delimiter) = pattern.split_delimiter() {
+                let delimiter = delimiter.clone();
+                let make_func = move || unsafe {
+                    let delimiter = delimiter.clone();
+                    let scratch = RefCell::new(Vec::new());
+                    move |s: &str| {
+                        let mut parts = scratch.borrow_mut();
+                        text::split_by_delimiter(s, &delimiter, &mut parts);
+                        split_parts(s, &parts)
+                    }
+                };
+                return core::map_pylist(py, list, jobs, inplace, make_func);
+            }
+
+            let prefilter = pattern.prefilter().clone();
+            let pattern = capture_regex(&pattern)?;
 
             let make_func = move || unsafe {
                 let pattern = pattern.clone();
-                move |s: &str| text::split_by_regexp_string(s, &pattern).to_py_object()
+                let prefilter = prefilter.clone();
+                let scratch = RefCell::new(Vec::new());
+                move |s: &str| {
+                    if !prefilter.may_match(s) {
+                        return split_parts(s, &[0..s.len()]);
+                    }
+                    let mut parts = scratch.borrow_mut();
+                    text::split_by_regexp_string(s, &pattern, &mut parts);
+                    split_parts(s, &parts)
+                }
             };
 
             let list = core::map_pylist(py, list, jobs, inplace, make_func)?;
             Ok(list)
         }
 
+        // One list per row, sized from the worker's scratch ranges; safe off
+        // the GIL thread like the other `str` conversions
+        unsafe fn split_parts(s: &str, parts: &[Range<usize>]) -> core::PyObjectPtr {
+            let row = object::create_list_empty(parts.len() as isize);
+            assert!(!row.is_null());
+            for (index, range) in parts.iter().enumerate() {
+                let part = s[range.clone()].to_py_object();
+                object::list_set_item_transfer(row, index as isize, part.0);
+            }
+            core::PyObjectPtr(row)
+        }
+
         #[pyfunction]
         fn replace_regexp_in_string(
             py: Python,
             list: &Bound<PyList>,
-            pattern: &Bound<PyString>,
+            pattern: &Bound<PyAny>,
             replacement: &Bound<PyString>,
             count: usize,
             case: bool,
             jobs: usize,
             inplace: bool,
         ) -> PyResult<PyObject> {
-            let pattern = RegexBuilder::new(&pattern.to_string())
-                .case_insensitive(case)
-                .build()
-                .unwrap();
+            let pattern = resolve_pattern(pattern, case)?;
 
             let replacement_str = replacement.to_string();
 
+            // `foo|bar|baz` with a `$`-free replacement needs no regex engine:
+            // one Aho-Corasick pass finds every alternative
+            if !replacement_str.contains('$') {
+                if let Some(searcher) = pattern.literal_searcher() {
+                    let replacements = vec![replacement_str; searcher.patterns_len()];
+                    return replace_literals(
+                        py,
+                        list,
+                        searcher.clone(),
+                        replacements,
+                        count,
+                        jobs,
+                        inplace,
+                    );
+                }
+            }
+
+            let prefilter = pattern.prefilter().clone();
+            let pattern = capture_regex(&pattern)?;
+
             let make_func = move || unsafe {
                 let pattern = pattern.clone();
+                let prefilter = prefilter.clone();
                 let replacement = replacement_str.clone();
+                let scratch = RefCell::new(String::new());
                 move |s: &str| {
-                    text::replace_regexp_in_string(s, &pattern, &replacement, count).to_py_object()
+                    if !prefilter.may_match(s) {
+                        return MapResult::Unchanged;
+                    }
+                    let mut out = scratch.borrow_mut();
+                    let changed =
+                        text::replace_regexp_in_string(s, &pattern, &replacement, count, &mut out);
+                    replaced(changed, &out)
                 }
             };
 
@@ -165,6 +738,67 @@ mod yurki {
             Ok(list)
         }
 
+        #[pyfunction]
+        fn replace_multi_in_string(
+            py: Python,
+            list: &Bound<PyList>,
+            patterns: Vec<String>,
+            replacements: Vec<String>,
+            jobs: usize,
+            inplace: bool,
+        ) -> PyResult<PyObject> {
+            if patterns.len() != replacements.len() {
+                return Err(PyValueError::new_err(format!(
+                    "got {} patterns but {} replacements",
+                    patterns.len(),
+                    replacements.len()
+                )));
+            }
+            if patterns.iter().any(String::is_empty) {
+                return Err(PyValueError::new_err("patterns must be non-empty strings"));
+            }
+
+            let searcher = pattern::literal_searcher(&patterns, false)
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+            replace_literals(py, list, searcher, replacements, 0, jobs, inplace)
+        }
+
+        fn replace_literals(
+            py: Python,
+            list: &Bound<PyList>,
+            searcher: AhoCorasick,
+            replacements: Vec<String>,
+            count: usize,
+            jobs: usize,
+            inplace: bool,
+        ) -> PyResult<PyObject> {
+            let replacements: Arc<[String]> = replacements.into();
+
+            let make_func = move || unsafe {
+                let searcher = searcher.clone();
+                let replacements = replacements.clone();
+                let scratch = RefCell::new(String::new());
+                move |s: &str| {
+                    let mut out = scratch.borrow_mut();
+                    let changed =
+                        text::replace_literals_in_string(s, &searcher, &replacements, count, &mut out);
+                    replaced(changed, &out)
+                }
+            };
+
+            core::map_pylist(py, list, jobs, inplace, make_func)
+        }
+
+        // Rows the pattern misses hand back the input object, no copy; the
+        // rest are copied out of the worker's scratch buffer
+        unsafe fn replaced(changed: bool, out: &str) -> MapResult {
+            if changed {
+                MapResult::Object(out.to_py_object())
+            } else {
+                MapResult::Unchanged
+            }
+        }
+
         /// Hack: workaround for https://github.com/PyO3/pyo3/issues/759
         #[pymodule_init]
         fn init(m: &Bound<'_, PyModule>) -> PyResult<()> {
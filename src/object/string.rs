@@ -24,6 +24,9 @@ unsafe fn internal_free_bytes(ptr: *mut std::ffi::c_void, size: usize) {
 
 static mut STRING_TYPE: *mut ffi::PyTypeObject = std::ptr::null_mut();
 
+// CPython's empty `str` singleton, immortal on 3.12+
+static mut EMPTY_STRING: *mut ffi::PyObject = std::ptr::null_mut();
+
 unsafe extern "C" fn string_alloc(
     type_object: *mut ffi::PyTypeObject,
     item_count: ffi::Py_ssize_t,
@@ -147,6 +150,13 @@ pub unsafe fn init_string_type(m: *mut ffi::PyObject) -> PyResult<()> {
     }
 
     STRING_TYPE = typ;
+
+    let empty = ffi::PyUnicode_FromStringAndSize(b"\0".as_ptr() as *const _, 0);
+    if empty.is_null() {
+        return Err(PyErr::fetch(Python::assume_gil_acquired()));
+    }
+    EMPTY_STRING = empty;
+
     ffi::PyModule_AddObject(m, b"String\0".as_ptr() as *const _ as *mut _, typ as _);
     Ok(())
 }
@@ -158,6 +168,13 @@ pub unsafe fn init_string_type(m: *mut ffi::PyObject) -> PyResult<()> {
 pub unsafe fn create_fast_string(text: &str) -> *mut ffi::PyObject {
     debug_println!("create_fast_string: input {:?}", text);
 
+    // Every empty result shares the interpreter's singleton; it is immortal,
+    // so like the bool singletons it needs no refcount bump
+    let empty = EMPTY_STRING;
+    if text.is_empty() && !empty.is_null() {
+        return empty;
+    }
+
     // SIMD-accelerated analysis: get max codepoint and length in one pass
     let (character_count, max_codepoint) = simd::analyze_utf8_simd(text.as_bytes());
 
@@ -0,0 +1,361 @@
+//! Compiled regex bundle shared by the Python entry points.
+
+use crate::builtin::{self, DenseRegex};
+use crate::simd::ByteSet;
+use aho_corasick::{AhoCorasick, MatchKind};
+use memchr::memmem;
+use regex::{Regex, RegexBuilder};
+use regex_automata::meta;
+use regex_automata::nfa::thompson::WhichCaptures;
+use regex_automata::util::syntax;
+use regex_syntax::ast::{self, Ast};
+use regex_syntax::hir::literal::{Extractor, Seq};
+use std::ops::Range;
+use std::sync::{Arc, OnceLock};
+
+/// Engine answering whole-match searches.
+#[derive(Clone, Debug)]
+pub enum Matcher {
+    /// Compiled at runtime, searched with the lazy DFA.
+    Meta(meta::Regex),
+    /// Dense DFA embedded at build time.
+    Dense(&'static DenseRegex),
+}
+
+impl Matcher {
+    #[inline]
+    pub fn find(&self, haystack: &str) -> Option<Range<usize>> {
+        match self {
+            Matcher::Meta(re) => re.find(haystack).map(|m| m.range()),
+            Matcher::Dense(re) => re.find(haystack).map(|m| m.range()),
+        }
+    }
+
+    #[inline]
+    pub fn is_match(&self, haystack: &str) -> bool {
+        match self {
+            Matcher::Meta(re) => re.is_match(haystack),
+            Matcher::Dense(re) => re.is_match(haystack),
+        }
+    }
+}
+
+/// A regex pattern compiled for the search modes the entry points need.
+///
+/// `find` and `is_match` only ever report the overall match span, so they run
+/// on a `meta::Regex` built without capture slots: the NFA is smaller and the
+/// lazy DFA answers every search without falling back to the PikeVM. The
+/// capture-aware `Regex` used by `capture`, `split` and `replace` is built on
+/// first use, so match-only workloads never pay for it. The same goes for the
+/// Aho-Corasick searcher `replace` uses when the pattern is a plain alternation
+/// of literals, and the memchr delimiter `split` uses when the pattern is a
+/// single literal or a small byte set, and the required-literal `Prefilter`
+/// every entry point checks before running a regex, and the byte-oriented regex
+/// behind the `bytes` entry points. Clones share those slots.
+#[derive(Clone, Debug)]
+pub struct Pattern {
+    source: String,
+    case: bool,
+    matcher: Matcher,
+    regex: Arc<OnceLock<Regex>>,
+    literals: Arc<OnceLock<Option<AhoCorasick>>>,
+    delimiter: Arc<OnceLock<Option<Delimiter>>>,
+    prefilter: Arc<OnceLock<Prefilter>>,
+    bytes_regex: Arc<OnceLock<regex::bytes::Regex>>,
+}
+
+impl Pattern {
+    pub fn new(source: &str, case: bool) -> Result<Self, meta::BuildError> {
+        let matcher = meta::Builder::new()
+            .syntax(syntax::Config::new().case_insensitive(case))
+            .configure(meta::Config::new().which_captures(WhichCaptures::Implicit))
+            .build(source)?;
+
+        Ok(Self {
+            source: source.to_string(),
+            case,
+            matcher: Matcher::Meta(matcher),
+            regex: Arc::new(OnceLock::new()),
+            literals: Arc::new(OnceLock::new()),
+            delimiter: Arc::new(OnceLock::new()),
+            prefilter: Arc::new(OnceLock::new()),
+            bytes_regex: Arc::new(OnceLock::new()),
+        })
+    }
+
+    /// Pattern backed by a build-time DFA, see `crate::builtin`.
+    pub fn builtin(name: &str) -> Option<Self> {
+        let builtin = builtin::lookup(name)?;
+
+        Some(Self {
+            source: builtin.pattern.to_string(),
+            case: false,
+            matcher: Matcher::Dense(builtin.regex()),
+            regex: Arc::new(OnceLock::new()),
+            literals: Arc::new(OnceLock::new()),
+            delimiter: Arc::new(OnceLock::new()),
+            prefilter: Arc::new(OnceLock::new()),
+            bytes_regex: Arc::new(OnceLock::new()),
+        })
+    }
+
+    pub fn as_str(&self) -> &str {
+        &self.source
+    }
+
+    pub fn case(&self) -> bool {
+        self.case
+    }
+
+    /// Capture-free engine for whole-match searches.
+    pub fn matcher(&self) -> &Matcher {
+        &self.matcher
+    }
+
+    /// Capture-aware engine, compiled on first use.
+    pub fn regex(&self) -> Result<&Regex, regex::Error> {
+        if let Some(regex) = self.regex.get() {
+            return Ok(regex);
+        }
+
+        let regex = RegexBuilder::new(&self.source)
+            .case_insensitive(self.case)
+            .build()?;
+        Ok(self.regex.get_or_init(|| regex))
+    }
+
+    /// Byte-oriented engine for the `bytes` entry points, compiled on first use.
+    ///
+    /// Classes and case folding are ASCII-only, like a `bytes` pattern in `re`,
+    /// which keeps the DFA small. Patterns that only build with Unicode on, such
+    /// as `\p{L}` or `(?u)\w`, retry with it.
+    pub fn bytes_regex(&self) -> Result<&regex::bytes::Regex, regex::Error> {
+        if let Some(regex) = self.bytes_regex.get() {
+            return Ok(regex);
+        }
+
+        let build = |unicode| {
+            regex::bytes::RegexBuilder::new(&self.source)
+                .case_insensitive(self.case)
+                .unicode(unicode)
+                .build()
+        };
+        let regex = build(false).or_else(|_| build(true))?;
+        Ok(self.bytes_regex.get_or_init(|| regex))
+    }
+
+    /// Multi-literal searcher for patterns like `foo|bar|baz`, built on first use.
+    ///
+    /// `None` when the pattern uses anything beyond literals, groups and a
+    /// top-level alternation. Case-insensitive patterns qualify when ASCII
+    /// folding matches exactly what the regex would, see `ascii_folds_exactly`.
+    pub fn literal_searcher(&self) -> Option<&AhoCorasick> {
+        self.literals
+            .get_or_init(|| {
+                let ast = ast::parse::Parser::new().parse(&self.source).ok()?;
+                let needles = literal_alternatives(&ast)?;
+                if self.case && !needles.iter().all(|needle| ascii_folds_exactly(needle)) {
+                    return None;
+                }
+                literal_searcher(&needles, self.case).ok()
+            })
+            .as_ref()
+    }
+
+    /// Delimiter for `split` patterns like `,`, `[,;]` or `, `, built on first use.
+    ///
+    /// `None` when the pattern takes the regex engine to match, or when it is
+    /// case-insensitive and has letters in it.
+    pub fn split_delimiter(&self) -> Option<&Delimiter> {
+        self.delimiter
+            .get_or_init(|| {
+                let ast = ast::parse::Parser::new().parse(&self.source).ok()?;
+                Delimiter::from_ast(&ast, self.case)
+            })
+            .as_ref()
+    }
+
+    /// Literal every match contains, built on first use, see `Prefilter`.
+    pub fn prefilter(&self) -> &Prefilter {
+        self.prefilter
+            .get_or_init(|| Prefilter::new(&self.source, self.case))
+    }
+}
+
+/// Substring every match of a pattern contains, checked with memmem before a
+/// row reaches the regex engine.
+///
+/// The regex engines prefilter on literal prefixes too, but only once a search
+/// is set up; rows without the literal skip that entirely. The literal is the
+/// longest common prefix or suffix of the pattern's literal prefixes, so
+/// `[Tt]est\s+\w+` requires `est` and `\btest\b` requires `test`. Patterns
+/// without one, like `\d+` or `a|b`, let every row through.
+#[derive(Clone, Debug)]
+pub struct Prefilter(Option<memmem::Finder<'static>>);
+
+impl Prefilter {
+    fn new(source: &str, case: bool) -> Self {
+        let required = regex_syntax::ParserBuilder::new()
+            .case_insensitive(case)
+            .build()
+            .parse(source)
+            .ok()
+            .and_then(|hir| required_literal(&Extractor::new().extract(&hir)));
+        Self(required.map(|needle| memmem::Finder::new(&needle).into_owned()))
+    }
+
+    /// False only when `haystack` can't contain a match.
+    #[inline]
+    pub fn may_match(&self, haystack: &str) -> bool {
+        match &self.0 {
+            Some(finder) => finder.find(haystack.as_bytes()).is_some(),
+            None => true,
+        }
+    }
+}
+
+/// Longest byte string shared as a prefix or suffix by every literal in
+/// `prefixes`: each match starts with one of them, so it contains that string.
+/// Single bytes turn up in too many rows to be worth the scan.
+fn required_literal(prefixes: &Seq) -> Option<Vec<u8>> {
+    let literals = prefixes.literals()?;
+    let first = literals.first()?.as_bytes();
+    let (mut prefix, mut suffix) = (first.len(), first.len());
+    for literal in &literals[1..] {
+        let bytes = literal.as_bytes();
+        prefix = prefix.min(first.iter().zip(bytes).take_while(|(a, b)| a == b).count());
+        suffix = suffix.min(
+            first.iter().rev().zip(bytes.iter().rev()).take_while(|(a, b)| a == b).count(),
+        );
+    }
+
+    let required = if prefix >= suffix { &first[..prefix] } else { &first[first.len() - suffix..] };
+    (required.len() > 1).then(|| required.to_vec())
+}
+
+/// Delimiter a `split` can find with memchr or a SIMD byte-set scan instead
+/// of the regex engine.
+///
+/// Byte delimiters are always ASCII, so every hit is a char boundary.
+#[derive(Clone, Debug)]
+pub enum Delimiter {
+    One(u8),
+    Two(u8, u8),
+    Three(u8, u8, u8),
+    /// Four or more bytes, past what `memchr` covers.
+    Set(ByteSet),
+    Literal(memmem::Finder<'static>),
+}
+
+impl Delimiter {
+    fn from_ast(ast: &Ast, case: bool) -> Option<Self> {
+        let needles = match ast {
+            Ast::ClassBracketed(class) if !class.negated => class_literals(&class.kind)?,
+            _ => literal_alternatives(ast)?,
+        };
+        // Without letters, case-insensitive matching is plain matching
+        let has_case =
+            |needle: &String| needle.bytes().any(|b| !b.is_ascii() || b.is_ascii_alphabetic());
+        if case && needles.iter().any(has_case) {
+            return None;
+        }
+
+        if let [needle] = needles.as_slice() {
+            if needle.len() > 1 {
+                return Some(Delimiter::Literal(
+                    memmem::Finder::new(needle.as_bytes()).into_owned(),
+                ));
+            }
+        }
+
+        let bytes: Vec<u8> = needles
+            .iter()
+            .map(|needle| match needle.as_bytes() {
+                &[byte] => Some(byte),
+                _ => None,
+            })
+            .collect::<Option<_>>()?;
+        match *bytes.as_slice() {
+            [a] => Some(Delimiter::One(a)),
+            [a, b] => Some(Delimiter::Two(a, b)),
+            [a, b, c] => Some(Delimiter::Three(a, b, c)),
+            _ => ByteSet::new(&bytes).map(Delimiter::Set),
+        }
+    }
+}
+
+/// Leftmost-first searcher over `needles`: the earliest match wins and, among
+/// matches starting at the same offset, the needle listed first, exactly like
+/// a regex alternation. `ascii_case` folds ASCII letters only.
+pub fn literal_searcher<P: AsRef<[u8]>>(
+    needles: &[P],
+    ascii_case: bool,
+) -> Result<AhoCorasick, aho_corasick::BuildError> {
+    AhoCorasick::builder()
+        .match_kind(MatchKind::LeftmostFirst)
+        .ascii_case_insensitive(ascii_case)
+        .build(needles)
+}
+
+/// Whether ASCII-only case folding of `needle` finds the same matches as the
+/// regex's Unicode simple case folding. True for ASCII needles without `k` or
+/// `s`, the only ASCII letters with non-ASCII case partners (KELVIN SIGN and
+/// LATIN SMALL LETTER LONG S).
+fn ascii_folds_exactly(needle: &str) -> bool {
+    needle
+        .bytes()
+        .all(|b| b.is_ascii() && !matches!(b.to_ascii_lowercase(), b'k' | b's'))
+}
+
+/// Alternatives of a pattern that is a bare alternation of non-empty literals.
+fn literal_alternatives(ast: &Ast) -> Option<Vec<String>> {
+    let branches = match ast {
+        Ast::Alternation(alternation) => alternation.asts.iter().collect(),
+        _ => vec![ast],
+    };
+
+    branches
+        .into_iter()
+        .map(|branch| {
+            let mut literal = String::new();
+            push_literal(branch, &mut literal)?;
+            (!literal.is_empty()).then_some(literal)
+        })
+        .collect()
+}
+
+fn push_literal(ast: &Ast, out: &mut String) -> Option<()> {
+    match ast {
+        Ast::Literal(literal) => out.push(literal.c),
+        Ast::Concat(concat) => {
+            for ast in &concat.asts {
+                push_literal(ast, out)?;
+            }
+        }
+        // Groups only matter for `$n` references, which the caller rules out;
+        // `(?i:...)` style groups change what matches, so they don't qualify
+        Ast::Group(group) => match &group.kind {
+            ast::GroupKind::NonCapturing(flags) if !flags.items.is_empty() => return None,
+            _ => push_literal(&group.ast, out)?,
+        },
+        _ => return None,
+    }
+    Some(())
+}
+
+/// Members of a bracketed class made only of literals, like `[,;]`.
+fn class_literals(set: &ast::ClassSet) -> Option<Vec<String>> {
+    let items = match set {
+        ast::ClassSet::Item(ast::ClassSetItem::Union(union)) => union.items.iter().collect(),
+        ast::ClassSet::Item(item) => vec![item],
+        ast::ClassSet::BinaryOp(_) => return None,
+    };
+
+    items
+        .into_iter()
+        .map(|item| match item {
+            ast::ClassSetItem::Literal(literal) => Some(literal.c.to_string()),
+            _ => None,
+        })
+        .collect()
+}
@@ -0,0 +1,153 @@
+//! Nibble-table search for sets of ASCII delimiter bytes.
+//!
+//! Used by `split` on classes such as `[,;:|]`, which are too large for
+//! `memchr3`. Each byte is classified with two 16-entry table lookups
+//! (`pshufb` on x86, `tbl` on NEON), one per nibble:
+//!
+//! - `lo[n]` has bit `h` set when byte `h << 4 | n` is in the set;
+//! - `hi[h]` is `1 << h` for the 8 ASCII high nibbles and 0 above.
+//!
+//! A byte is a member exactly when `lo[low nibble] & hi[high nibble] != 0`.
+//! Bucketing by high nibble makes the test exact for any ASCII set, with no
+//! false positives to re-check, and non-ASCII bytes never match, so every hit
+//! is a char boundary.
+
+use core::simd::Simd;
+use core::simd::cmp::SimdPartialEq;
+
+type U8x16 = Simd<u8, 16>;
+
+#[derive(Clone, Debug)]
+pub struct ByteSet {
+    lo: [u8; 16],
+    hi: [u8; 16],
+}
+
+impl ByteSet {
+    /// `None` if any byte is outside ASCII.
+    pub fn new(bytes: &[u8]) -> Option<Self> {
+        let mut lo = [0u8; 16];
+        let mut hi = [0u8; 16];
+        for (h, bucket) in hi.iter_mut().enumerate().take(8) {
+            *bucket = 1 << h;
+        }
+        for &byte in bytes {
+            if !byte.is_ascii() {
+                return None;
+            }
+            lo[(byte & 0x0F) as usize] |= 1 << (byte >> 4);
+        }
+        Some(Self { lo, hi })
+    }
+
+    #[inline(always)]
+    pub fn contains(&self, byte: u8) -> bool {
+        self.lo[(byte & 0x0F) as usize] & self.hi[(byte >> 4) as usize] != 0
+    }
+
+    /// Calls `f` with the offset of every member byte of `haystack`, in order.
+    pub fn for_each_hit(&self, haystack: &[u8], f: impl FnMut(usize)) {
+        // Baseline x86-64 has no `pshufb`, and `swizzle_dyn` picks its lowering
+        // when core is compiled, so the SSSE3 copy calls the intrinsic itself
+        #[cfg(all(target_arch = "x86_64", not(target_feature = "ssse3")))]
+        if std::is_x86_feature_detected!("ssse3") {
+            return unsafe { self.for_each_hit_ssse3(haystack, f) };
+        }
+
+        self.for_each_hit_with(haystack, f, |table, idx| table.swizzle_dyn(idx))
+    }
+
+    #[cfg(all(target_arch = "x86_64", not(target_feature = "ssse3")))]
+    #[target_feature(enable = "ssse3")]
+    unsafe fn for_each_hit_ssse3(&self, haystack: &[u8], f: impl FnMut(usize)) {
+        use core::arch::x86_64::{__m128i, _mm_shuffle_epi8};
+
+        self.for_each_hit_with(haystack, f, |table, idx| {
+            let table: __m128i = table.into();
+            U8x16::from(_mm_shuffle_epi8(table, idx.into()))
+        })
+    }
+
+    #[inline(always)]
+    fn for_each_hit_with(
+        &self,
+        haystack: &[u8],
+        mut f: impl FnMut(usize),
+        lookup: impl Fn(U8x16, U8x16) -> U8x16,
+    ) {
+        let lo = U8x16::from_array(self.lo);
+        let hi = U8x16::from_array(self.hi);
+        let nibble = U8x16::splat(0x0F);
+
+        let mut chunks = haystack.chunks_exact(16);
+        let mut base = 0;
+        for chunk in &mut chunks {
+            let v = U8x16::from_slice(chunk);
+            let buckets = lookup(lo, v & nibble) & lookup(hi, (v >> 4) & nibble);
+            let mut bits = buckets.simd_ne(U8x16::splat(0)).to_bitmask();
+            while bits != 0 {
+                f(base + bits.trailing_zeros() as usize);
+                bits &= bits - 1;
+            }
+            base += 16;
+        }
+
+        for (offset, &byte) in chunks.remainder().iter().enumerate() {
+            if self.contains(byte) {
+                f(base + offset);
+            }
+        }
+    }
+}
+
+// ========================================================================== //
+//                                   Tests                                    //
+// ========================================================================== //
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn hits(set: &ByteSet, haystack: &[u8]) -> Vec<usize> {
+        let mut hits = Vec::new();
+        set.for_each_hit(haystack, |i| hits.push(i));
+        hits
+    }
+
+    fn naive(bytes: &[u8], haystack: &[u8]) -> Vec<usize> {
+        (0..haystack.len())
+            .filter(|&i| bytes.contains(&haystack[i]))
+            .collect()
+    }
+
+    #[test]
+    fn byte_set_rejects_non_ascii() {
+        assert!(ByteSet::new(&[b',', 0xC3]).is_none());
+    }
+
+    #[test]
+    fn byte_set_shared_low_nibble() {
+        // ',' (0x2C) and '|' (0x7C) share a low nibble
+        let set = ByteSet::new(b",;:|").unwrap();
+        let haystack = b"a,b;c:d|e\x0c\x3c\x6c,";
+        assert_eq!(hits(&set, haystack), naive(b",;:|", haystack));
+    }
+
+    #[test]
+    fn byte_set_every_byte() {
+        let members = b" \t\n,;:|-_/.";
+        let set = ByteSet::new(members).unwrap();
+        let haystack: Vec<u8> = (0..=255u8).cycle().take(1000).collect();
+        assert_eq!(hits(&set, &haystack), naive(members, &haystack));
+        for byte in 0..=255u8 {
+            assert_eq!(set.contains(byte), members.contains(&byte));
+        }
+    }
+
+    #[test]
+    fn byte_set_utf8_continuation_bytes() {
+        let set = ByteSet::new(b",;").unwrap();
+        let haystack = "привет,мир;你好,".as_bytes();
+        assert_eq!(hits(&set, haystack), naive(b",;", haystack));
+    }
+}
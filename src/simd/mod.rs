@@ -11,10 +11,12 @@ use core::simd::cmp::{SimdPartialEq, SimdPartialOrd};
 use core::simd::prelude::SimdUint;
 use core::simd::{LaneCount, Simd, SupportedLaneCount};
 
+pub mod delim;
 pub mod ucs1;
 pub mod ucs2;
 pub mod ucs4;
 
+pub use delim::ByteSet;
 pub use ucs1::{ucs1_to_utf8, ucs1_to_utf8_bump, utf8_to_ucs1_simd};
 pub use ucs2::{ucs2_to_utf8, ucs2_to_utf8_bump, utf8_to_ucs2_simd};
 pub use ucs4::{ucs4_to_utf8, ucs4_to_utf8_bump, utf8_to_ucs4_simd};
@@ -325,6 +327,27 @@ pub fn analyze_utf8_simd(input: &[u8]) -> (usize, u32) {
 /// The caller must ensure the `PyObject` pointer is valid, non-null, and points
 /// to a Python unicode object. The GIL must also be held.
 pub fn convert_pystring<'a>(o: *mut pyo3::ffi::PyObject, bump: &'a bumpalo::Bump) -> &'a str {
+    // Lane widths above are fixed at compile time, so a baseline x86-64 build
+    // keeps 16-byte vectors; on AVX2 CPUs it still runs a copy of the codecs
+    // compiled with AVX2 enabled. The feature check is a cached atomic load.
+    #[cfg(all(target_arch = "x86_64", not(target_feature = "avx2")))]
+    if std::is_x86_feature_detected!("avx2") {
+        return unsafe { convert_pystring_avx2(o, bump) };
+    }
+
+    convert_pystring_generic(o, bump)
+}
+
+#[cfg(all(target_arch = "x86_64", not(target_feature = "avx2")))]
+#[target_feature(enable = "avx2")]
+unsafe fn convert_pystring_avx2<'a>(o: *mut pyo3::ffi::PyObject, bump: &'a bumpalo::Bump) -> &'a str {
+    convert_pystring_generic(o, bump)
+}
+
+// Inlined into each `convert_pystring` variant, together with the codecs, so
+// every variant is compiled for its own target features
+#[inline(always)]
+fn convert_pystring_generic<'a>(o: *mut pyo3::ffi::PyObject, bump: &'a bumpalo::Bump) -> &'a str {
     unsafe {
         use pyo3::ffi as pyo3_ffi;
         assert!(!o.is_null());
@@ -120,7 +120,7 @@ fn utf8_to_ucs1_scalar(input: &[u8], output: &mut [u8]) -> usize {
 /// The implementation processes chunks of the input using SIMD vectors. If a
 /// chunk is entirely ASCII, it is copied directly. If it contains non-ASCII
 /// bytes, they are expanded into their 2-byte UTF-8 representation.
-#[inline]
+#[inline(always)]
 pub fn ucs1_to_utf8_bump<'a>(input: &'a [u8], bump: &'a bumpalo::Bump) -> &'a str {
     // Use scalar for short strings to avoid SIMD overhead
     if input.len() < SIMD_THRESHOLD_UCS1 {
@@ -201,7 +201,7 @@ fn expand_ucs2_block(block: &[u16], out: &mut Vec<u8>) {
 /// This function uses SIMD for performance on larger inputs. It checks for ASCII
 /// fast paths and falls back to a scalar routine for blocks containing
 /// surrogate pairs, which require special handling.
-#[inline]
+#[inline(always)]
 pub fn ucs2_to_utf8_bump<'a>(input: &[u16], bump: &'a bumpalo::Bump) -> &'a str {
     if input.len() < SIMD_THRESHOLD_UCS2 {
         return ucs2_to_utf8_scalar_bump(input, bump);
@@ -112,7 +112,7 @@ fn push_utf32_scalar(cp: u32, out: &mut Vec<u8>) {
 /// This function uses SIMD for performance on larger inputs. It includes a
 /// fast path for ASCII and a scalar fallback for blocks containing
 /// supplementary-plane characters.
-#[inline]
+#[inline(always)]
 pub fn ucs4_to_utf8_bump<'a>(input: &[u32], bump: &'a bumpalo::Bump) -> &'a str {
     if input.len() < SIMD_THRESHOLD_UCS4 {
         return ucs4_to_utf8_scalar_bump(input, bump);
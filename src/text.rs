@@ -1,44 +1,183 @@
-use regex::Regex;
+use crate::pattern::{Delimiter, Matcher};
+use aho_corasick::AhoCorasick;
+use regex::{CaptureLocations, Regex};
 use std::borrow::Cow;
+use std::ops::Range;
 
-pub fn find_in_string<'a>(string: &'a str, _pattern: &Regex) -> Cow<'a, str> {
+pub fn find_in_string<'a>(string: &'a str, _pattern: &Matcher) -> Cow<'a, str> {
     _pattern
         .find(string)
-        .map(|m| Cow::Borrowed(m.as_str()))
+        .map(|range| Cow::Borrowed(&string[range]))
         .unwrap_or(Cow::Borrowed(""))
 }
 
-pub fn is_match_in_string(string: &str, pattern: &Regex) -> bool {
+pub fn is_match_in_string(string: &str, pattern: &Matcher) -> bool {
     pattern.is_match(string)
 }
 
-pub fn capture_regex_in_string<'a>(string: &'a str, _pattern: &Regex) -> Vec<Cow<'a, str>> {
-    _pattern
-        .captures(string)
-        .map(|caps| {
-            caps.iter()
-                .map(|m| {
-                    m.map(|m| Cow::Borrowed(m.as_str()))
-                        .unwrap_or(Cow::Borrowed(""))
-                })
-                .collect()
+// `locs` is scratch space owned by the calling worker, so a search doesn't
+// allocate a fresh `Captures` per string
+pub fn capture_regex_in_string<'a>(
+    string: &'a str,
+    _pattern: &Regex,
+    locs: &mut CaptureLocations,
+) -> Vec<Cow<'a, str>> {
+    if _pattern.captures_read(locs, string).is_none() {
+        return Vec::new();
+    }
+
+    (0..locs.len())
+        .map(|i| {
+            locs.get(i)
+                .map(|(start, end)| Cow::Borrowed(&string[start..end]))
+                .unwrap_or(Cow::Borrowed(""))
         })
-        .unwrap_or_else(Vec::new)
+        .collect()
 }
 
-pub fn split_by_regexp_string<'a>(string: &'a str, _pattern: &Regex) -> Vec<Cow<'a, str>> {
-    _pattern.split(string).map(Cow::Borrowed).collect()
+// Ranges of the parts `Regex::split` would return, written into `parts`:
+// scratch space owned by the calling worker and reused across its strings,
+// so a row doesn't grow a fresh `Vec` of its own
+pub fn split_by_regexp_string(string: &str, _pattern: &Regex, parts: &mut Vec<Range<usize>>) {
+    parts.clear();
+    let mut last = 0;
+    for m in _pattern.find_iter(string) {
+        parts.push(last..m.start());
+        last = m.end();
+    }
+    parts.push(last..string.len());
 }
 
-pub fn replace_regexp_in_string<'a>(
-    string: &'a str,
+// Same output as `split_by_regexp_string` for patterns that reduce to a
+// `Delimiter`, found with memchr/memmem or a `ByteSet` scan
+pub fn split_by_delimiter(string: &str, delimiter: &Delimiter, parts: &mut Vec<Range<usize>>) {
+    parts.clear();
+    let bytes = string.as_bytes();
+    match *delimiter {
+        Delimiter::One(a) => split_at_hits(bytes, memchr::memchr_iter(a, bytes), 1, parts),
+        Delimiter::Two(a, b) => split_at_hits(bytes, memchr::memchr2_iter(a, b, bytes), 1, parts),
+        Delimiter::Three(a, b, c) => {
+            split_at_hits(bytes, memchr::memchr3_iter(a, b, c, bytes), 1, parts)
+        }
+        Delimiter::Set(ref set) => {
+            let mut last = 0;
+            set.for_each_hit(bytes, |start| {
+                parts.push(last..start);
+                last = start + 1;
+            });
+            parts.push(last..bytes.len());
+        }
+        Delimiter::Literal(ref finder) => {
+            split_at_hits(bytes, finder.find_iter(bytes), finder.needle().len(), parts)
+        }
+    }
+}
+
+fn split_at_hits(
+    bytes: &[u8],
+    hits: impl Iterator<Item = usize>,
+    width: usize,
+    parts: &mut Vec<Range<usize>>,
+) {
+    let mut last = 0;
+    for start in hits {
+        parts.push(last..start);
+        last = start + width;
+    }
+    parts.push(last..bytes.len());
+}
+
+// Replacements are written into `out`, scratch space owned by the calling
+// worker and reused across its strings. Returns false, leaving `out` in an
+// unspecified state, when nothing matched.
+pub fn replace_regexp_in_string(
+    string: &str,
     _pattern: &Regex,
     replacement: &str,
     count: usize,
-) -> Cow<'a, str> {
-    if count == 0 {
-        _pattern.replace_all(string, replacement)
+    out: &mut String,
+) -> bool {
+    let limit = if count == 0 { usize::MAX } else { count };
+    out.clear();
+    let mut last = 0;
+    let mut matched = false;
+
+    // Same rule as `Regex::replace`: no `$` means nothing to expand
+    if !replacement.contains('$') {
+        for m in _pattern.find_iter(string).take(limit) {
+            out.push_str(&string[last..m.start()]);
+            out.push_str(replacement);
+            last = m.end();
+            matched = true;
+        }
+    } else {
+        for caps in _pattern.captures_iter(string).take(limit) {
+            let m = caps.get(0).unwrap();
+            out.push_str(&string[last..m.start()]);
+            caps.expand(replacement, out);
+            last = m.end();
+            matched = true;
+        }
+    }
+
+    out.push_str(&string[last..]);
+    matched
+}
+
+// Literal counterpart of `replace_regexp_in_string`: `replacements[i]` is
+// substituted for needle `i`, all needles are found in a single pass
+pub fn replace_literals_in_string<R: AsRef<str>>(
+    string: &str,
+    searcher: &AhoCorasick,
+    replacements: &[R],
+    count: usize,
+    out: &mut String,
+) -> bool {
+    let limit = if count == 0 { usize::MAX } else { count };
+    out.clear();
+    let mut last = 0;
+    let mut matched = false;
+
+    for m in searcher.find_iter(string).take(limit) {
+        out.push_str(&string[last..m.start()]);
+        out.push_str(replacements[m.pattern().as_usize()].as_ref());
+        last = m.end();
+        matched = true;
+    }
+
+    out.push_str(&string[last..]);
+    matched
+}
+
+// `bytes` counterparts: workers can't create `bytes` objects off the GIL, so
+// they return plain Rust data for the calling thread to wrap
+
+// Ranges of the parts `bytes::Regex::split` would return
+pub fn split_by_regexp_bytes(bytes: &[u8], pattern: &regex::bytes::Regex) -> Vec<Range<usize>> {
+    let mut parts = Vec::new();
+    let mut last = 0;
+    for m in pattern.find_iter(bytes) {
+        parts.push(last..m.start());
+        last = m.end();
+    }
+    parts.push(last..bytes.len());
+    parts
+}
+
+// `None` when nothing matched and the input can be reused as is
+pub fn replace_regexp_in_bytes(
+    bytes: &[u8],
+    pattern: &regex::bytes::Regex,
+    replacement: &[u8],
+    count: usize,
+) -> Option<Vec<u8>> {
+    let replaced = if count == 0 {
+        pattern.replace_all(bytes, replacement)
     } else {
-        _pattern.replacen(string, count, replacement)
+        pattern.replacen(bytes, count, replacement)
+    };
+    match replaced {
+        Cow::Borrowed(_) => None,
+        Cow::Owned(out) => Some(out),
     }
 }
@@ -0,0 +1,40 @@
+import inspect
+
+import pytest
+
+import yurki
+
+
+# Operations that take a `pattern` and are mirrored as `Pattern` methods
+PATTERN_OPERATIONS = [
+    "find",
+    "is_match",
+    "is_match_mask",
+    "is_match_into",
+    "capture",
+    "capture_flat",
+    "capture_columns",
+    "split",
+    "replace",
+    "find_bytes",
+    "split_bytes",
+    "replace_bytes",
+]
+
+
+class TestApi:
+    def test_package_exports(self):
+        assert yurki.regexp.__name__ == "yurki.regexp"
+        assert yurki.internal.__name__.endswith("internal")
+
+    @pytest.mark.parametrize("name", yurki.regexp.__all__)
+    def test_regexp_exports(self, name):
+        assert callable(getattr(yurki.regexp, name))
+
+    @pytest.mark.parametrize("name", PATTERN_OPERATIONS)
+    def test_pattern_methods(self, name):
+        function = inspect.signature(getattr(yurki.regexp, name))
+        method = inspect.signature(getattr(yurki.regexp.Pattern, name))
+        # Methods take the function's arguments minus `pattern` and `case`
+        expected = [p for p in function.parameters if p not in ("pattern", "case")]
+        assert [p for p in method.parameters if p != "self"] == expected
@@ -7,11 +7,14 @@ import yurki
 
 PATTERN = r"(hi_how_are_you)|(hello)|(привет\d+)"
 JOBS = [1, 4]
+COMPILED = yurki.regexp.compile(PATTERN)
+HANDLE = yurki.internal.CompiledRegex(PATTERN)
+RE_COMPILED = re.compile(PATTERN)
 
 
 def regex_capture_python(data, pattern):
-    compiled_pattern = re.compile(pattern)
-    return [[match.group(0)] + list(match.groups()) if (match := compiled_pattern.search(s)) else [] for s in data]
+    search = pattern.search
+    return [[match.group(0), *match.groups()] if (match := search(s)) else [] for s in data]
 
 
 def generate_test_data(size):
@@ -70,6 +73,42 @@ class TestCapture:
         result = yurki.regexp.capture(data=data, pattern=pattern, jobs=jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_compiled_pattern(self, jobs):
+        data = ["name: John, age: 25", "no match"]
+        pattern = yurki.regexp.compile(r"name: (\w+), age: (\d+)")
+        expected = [["name: John, age: 25", "John", "25"], []]
+        result = yurki.regexp.capture(data=data, pattern=pattern, jobs=jobs, inplace=False)
+        assert result == expected
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_capture_flat(self, jobs):
+        data = ["name: John, age: 25", "no match", "name: Jane, age: 30"]
+        pattern = r"name: (\w+), age: (\d+)"
+        offsets, values = yurki.regexp.capture_flat(data=data, pattern=pattern, jobs=jobs)
+        assert offsets == [0, 3, 3, 6]
+        rows = [values[start:stop] for start, stop in zip(offsets, offsets[1:])]
+        assert rows == yurki.regexp.capture(data=data, pattern=pattern, jobs=jobs)
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_capture_flat_empty_list(self, jobs):
+        assert yurki.regexp.capture_flat(data=[], pattern=COMPILED, jobs=jobs) == ([0], [])
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_capture_columns(self, jobs):
+        data = ["name: John, age: 25", "no match", "name: Jane, age: 30"]
+        pattern = r"name: (\w+), age: (\d+)"
+        columns = yurki.regexp.capture_columns(data=data, pattern=pattern, jobs=jobs)
+        assert columns == [
+            ["name: John, age: 25", "", "name: Jane, age: 30"],
+            ["John", "", "Jane"],
+            ["25", "", "30"],
+        ]
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_capture_columns_empty_list(self, jobs):
+        assert yurki.regexp.capture_columns(data=[], pattern=COMPILED, jobs=jobs) == [[], [], [], []]
+
 
 class TestBenchCaptureShort:
     @pytest.fixture
@@ -81,13 +120,36 @@ class TestBenchCaptureShort:
     def test_capture_rust_short(self, jobs, benchmark, test_data):
         data, expected = test_data
         expected_rust = [["" if x is None else x for x in groups] for groups in expected]
-        result = benchmark(yurki.internal.capture_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.capture_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected_rust
 
+    @pytest.mark.benchmark(group="capture-short")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_capture_rust_flat_short(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        offsets, values = benchmark(yurki.internal.capture_regex_in_string_flat, data, HANDLE, False, jobs)
+        assert offsets[-1] == len(values) == 4 * len(expected)
+        assert values[:4] == ["" if x is None else x for x in expected[0]]
+
+    @pytest.mark.benchmark(group="capture-short")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_capture_rust_columns_short(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        columns = benchmark(yurki.internal.capture_regex_in_string_columns, data, HANDLE, False, jobs)
+        assert len(columns) == 4 and len(columns[0]) == len(expected)
+        assert [column[0] for column in columns] == ["" if x is None else x for x in expected[0]]
+
     @pytest.mark.benchmark(group="capture-short")
     def test_capture_python_short(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_capture_python, data, PATTERN)
+        result = benchmark(regex_capture_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="capture-short")
+    def test_capture_re2_short(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_capture_python, data, re2.compile(PATTERN))
         assert result == expected
 
 
@@ -101,13 +163,36 @@ class TestBenchCaptureMedium:
     def test_capture_rust_medium(self, jobs, benchmark, test_data):
         data, expected = test_data
         expected_rust = [["" if x is None else x for x in groups] for groups in expected]
-        result = benchmark(yurki.internal.capture_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.capture_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected_rust
 
+    @pytest.mark.benchmark(group="capture-medium")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_capture_rust_flat_medium(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        offsets, values = benchmark(yurki.internal.capture_regex_in_string_flat, data, HANDLE, False, jobs)
+        assert offsets[-1] == len(values) == 4 * len(expected)
+        assert values[:4] == ["" if x is None else x for x in expected[0]]
+
+    @pytest.mark.benchmark(group="capture-medium")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_capture_rust_columns_medium(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        columns = benchmark(yurki.internal.capture_regex_in_string_columns, data, HANDLE, False, jobs)
+        assert len(columns) == 4 and len(columns[0]) == len(expected)
+        assert [column[0] for column in columns] == ["" if x is None else x for x in expected[0]]
+
     @pytest.mark.benchmark(group="capture-medium")
     def test_capture_python_medium(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_capture_python, data, PATTERN)
+        result = benchmark(regex_capture_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="capture-medium")
+    def test_capture_re2_medium(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_capture_python, data, re2.compile(PATTERN))
         assert result == expected
 
 
@@ -121,11 +206,34 @@ class TestBenchCaptureLong:
     def test_capture_rust_long(self, jobs, benchmark, test_data):
         data, expected = test_data
         expected_rust = [["" if x is None else x for x in groups] for groups in expected]
-        result = benchmark(yurki.internal.capture_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.capture_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected_rust
 
+    @pytest.mark.benchmark(group="capture-long")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_capture_rust_flat_long(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        offsets, values = benchmark(yurki.internal.capture_regex_in_string_flat, data, HANDLE, False, jobs)
+        assert offsets[-1] == len(values) == 4 * len(expected)
+        assert values[:4] == ["" if x is None else x for x in expected[0]]
+
+    @pytest.mark.benchmark(group="capture-long")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_capture_rust_columns_long(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        columns = benchmark(yurki.internal.capture_regex_in_string_columns, data, HANDLE, False, jobs)
+        assert len(columns) == 4 and len(columns[0]) == len(expected)
+        assert [column[0] for column in columns] == ["" if x is None else x for x in expected[0]]
+
     @pytest.mark.benchmark(group="capture-long")
     def test_capture_python_long(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_capture_python, data, PATTERN)
+        result = benchmark(regex_capture_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="capture-long")
+    def test_capture_re2_long(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_capture_python, data, re2.compile(PATTERN))
         assert result == expected
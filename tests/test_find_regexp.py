@@ -7,11 +7,14 @@ import yurki
 
 PATTERN = r"(hi_how_are_you)|(hello)|(привет\d+)"
 JOBS = [1, 4]
+COMPILED = yurki.regexp.compile(PATTERN)
+HANDLE = yurki.internal.CompiledRegex(PATTERN)
+RE_COMPILED = re.compile(PATTERN)
 
 
 def regex_find_python(data, pattern):
-    compiled_pattern = re.compile(pattern)
-    return [match.group(0) if (match := compiled_pattern.search(s)) else "" for s in data]
+    search = pattern.search
+    return [match.group(0) if (match := search(s)) else "" for s in data]
 
 
 def generate_test_data(size):
@@ -29,6 +32,14 @@ class TestFind:
         result = yurki.regexp.find(data=data, pattern=PATTERN, jobs=jobs, inplace=inplace)
         assert result == expected
 
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_find_parallel_chunks(self, inplace):
+        # Well over the minimum chunk size, so jobs=4 actually runs several workers
+        data, expected = generate_test_data(50_000)
+        result = yurki.regexp.find(data=data, pattern=PATTERN, jobs=4, inplace=inplace)
+        assert result == expected
+        assert (result is data) == inplace
+
     @pytest.mark.parametrize("jobs", JOBS)
     def test_empty_list(self, jobs):
         assert yurki.regexp.find(data=[], pattern=PATTERN, jobs=jobs, inplace=False) == []
@@ -40,6 +51,11 @@ class TestFind:
         result = yurki.regexp.find(data=data, pattern=PATTERN, jobs=jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_no_match_shares_empty_string(self, jobs):
+        result = yurki.regexp.find(data=["a", "b", "c"], pattern=PATTERN, jobs=jobs, inplace=False)
+        assert {id(s) for s in result} == {id("")}
+
     @pytest.mark.parametrize("jobs", JOBS)
     def test_unicode(self, jobs):
         data = ["привет_мир", "你好世界", "नमस्ते दुनिया"]
@@ -48,6 +64,136 @@ class TestFind:
         result = yurki.regexp.find(data=data, pattern=pattern, jobs=jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_compiled_pattern(self, jobs):
+        data, expected = generate_test_data(10)
+        result = yurki.regexp.find(data=data, pattern=COMPILED, jobs=jobs, inplace=False)
+        assert result == expected
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_compiled_case_insensitive(self, jobs):
+        data = ["Hello world", "HELLO", "bye"]
+        pattern = yurki.regexp.compile(r"hello", case=True)
+        expected = ["Hello", "HELLO", ""]
+        result = yurki.regexp.find(data=data, pattern=pattern, jobs=jobs, inplace=False)
+        assert result == expected
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_pattern_methods(self, jobs):
+        data, expected = generate_test_data(10)
+        assert COMPILED.find(data, jobs=jobs) == expected
+        assert COMPILED.is_match(data, jobs=jobs) == [True] * len(data)
+        assert COMPILED.replace(["say hello"], "hi", jobs=jobs) == ["say hi"]
+        assert repr(COMPILED) == f"Pattern({PATTERN!r}, case=False)"
+
+    def test_compile_is_cached(self):
+        assert yurki.regexp.compile(PATTERN) is COMPILED
+
+    def test_common_patterns_precompiled(self):
+        digits = yurki.regexp.compile(r"\d+")
+        assert digits is yurki.regexp.compile(r"\d+")
+        assert yurki.regexp.find(data=["a 12"], pattern=r"\d+") == ["12"]
+        assert yurki.regexp.compile(r"\d+", case=True) is not digits
+
+    def test_rejects_non_pattern(self):
+        with pytest.raises(TypeError):
+            yurki.regexp.find(data=["hello"], pattern=42)
+
+    def test_compiled_rejects_case_argument(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.find(data=["hello"], pattern=COMPILED, case=True)
+
+    def test_invalid_pattern(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.compile(r"(unclosed")
+
+    def test_invalid_pattern_not_cached(self):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                yurki.regexp.find(data=["a"], pattern=r"(unclosed")
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_precompiled_pattern(self, jobs):
+        data, expected = generate_test_data(10)
+        data.append("hello and hi_how_are_you")
+        expected.append("hello")
+        pattern = yurki.regexp.precompiled("hi_privet")
+        assert pattern.pattern == PATTERN
+        result = yurki.regexp.find(data=data, pattern=pattern, jobs=jobs, inplace=False)
+        assert result == expected
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_whole_match_reuses_input(self, jobs, inplace):
+        data = ["привет1", "say привет2", ""]
+        originals = list(data)
+        result = yurki.regexp.find(data=data, pattern=r"привет\d+|^$", jobs=jobs, inplace=inplace)
+        assert result == ["привет1", "привет2", ""]
+        assert result[0] is originals[0]
+
+    def test_whole_match_of_str_subclass(self):
+        class Text(str):
+            pass
+
+        result = yurki.regexp.find(data=[Text("hello")], pattern=r"hello")
+        assert result == ["hello"]
+        assert type(result[0]) is str
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_find_bytes(self, jobs):
+        data, expected = generate_test_data(10)
+        data = [s.encode() for s in data] + [b"hello", b"\xff\xfe no match"]
+        expected = [s.encode() for s in expected] + [b"hello", b""]
+        result = yurki.regexp.find_bytes(data=data, pattern=PATTERN, jobs=jobs)
+        assert result == expected
+        assert result[-2] is data[-2]
+
+    def test_find_bytes_ascii_classes(self):
+        data = ["x ٣٤ 12".encode()]
+        assert yurki.regexp.find_bytes(data=data, pattern=r"\d+") == [b"12"]
+        # A non-ASCII literal elsewhere in the pattern doesn't change the classes
+        assert yurki.regexp.find_bytes(data=["ы ٣٤ 12".encode()], pattern=r"\d+|ы") == ["ы".encode()]
+        assert yurki.regexp.find_bytes(data=["٣٤ 12".encode()], pattern=r"\d+|ы") == [b"12"]
+
+    def test_find_bytes_compiled(self):
+        data = [b"GET /index 200", b"no status"]
+        assert yurki.regexp.find_bytes(data=data, pattern=COMPILED) == [b"", b""]
+        digits = yurki.regexp.compile(r"\d{3}")
+        assert yurki.regexp.find_bytes(data=data, pattern=digits) == [b"200", b""]
+        assert digits.find_bytes(data) == [b"200", b""]
+        with pytest.raises(ValueError):
+            yurki.regexp.find_bytes(data=data, pattern=digits, case=True)
+
+    def test_find_bytes_unicode_classes(self):
+        data = ["12 привет".encode(), b"12 34"]
+        assert yurki.regexp.find_bytes(data=data, pattern=r"\p{L}+") == ["привет".encode(), b""]
+        assert yurki.regexp.find_bytes(data=["x ٣٤".encode()], pattern=r"(?u)\d+") == ["٣٤".encode()]
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_find_numpy_output(self, jobs):
+        numpy = pytest.importorskip("numpy")
+        data, expected = generate_test_data(10)
+        data += ["hello", "no match"]
+        expected += ["hello", ""]
+        result = yurki.regexp.find(data=data, pattern=PATTERN, jobs=jobs, output="numpy")
+        assert isinstance(result, numpy.ndarray) and result.dtype == object
+        assert result.tolist() == expected
+        assert result[-2] is data[-2]
+
+    def test_find_numpy_output_empty_list(self):
+        pytest.importorskip("numpy")
+        assert yurki.regexp.find(data=[], pattern=COMPILED, output="numpy").shape == (0,)
+
+    def test_find_rejects_unknown_output(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.find(data=["hello"], pattern=PATTERN, output="tuple")
+        with pytest.raises(ValueError):
+            yurki.regexp.find(data=["hello"], pattern=PATTERN, inplace=True, output="numpy")
+
+    def test_precompiled_unknown_name(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.precompiled("no_such_pattern")
+
 
 class TestBenchFindShort:
     @pytest.fixture
@@ -58,13 +204,45 @@ class TestBenchFindShort:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_find_rust_short(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.find_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.find_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.benchmark(group="find-short")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_find_rust_precompiled_short(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        pattern = yurki.internal.precompiled_regex("hi_privet")
+        result = benchmark(yurki.internal.find_regex_in_string, data, pattern, False, jobs, inplace=False)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="find-short")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_find_rust_bytes_short(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        data = [s.encode() for s in data]
+        result = benchmark(yurki.internal.find_regex_in_bytes, data, PATTERN, False, jobs)
+        assert result == [s.encode() for s in expected]
+
+    @pytest.mark.benchmark(group="find-short")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_find_rust_numpy_short(self, jobs, benchmark, test_data):
+        numpy = pytest.importorskip("numpy")
+        data, expected = test_data
+        out = numpy.empty(len(data), dtype=object)
+        benchmark(yurki.internal.find_regex_into, data, HANDLE, out, False, jobs)
+        assert out.tolist() == expected
+
     @pytest.mark.benchmark(group="find-short")
     def test_find_python_short(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_find_python, data, PATTERN)
+        result = benchmark(regex_find_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="find-short")
+    def test_find_re2_short(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_find_python, data, re2.compile(PATTERN))
         assert result == expected
 
 
@@ -77,13 +255,37 @@ class TestBenchFindMedium:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_find_rust_medium(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.find_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.find_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.benchmark(group="find-medium")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_find_rust_bytes_medium(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        data = [s.encode() for s in data]
+        result = benchmark(yurki.internal.find_regex_in_bytes, data, PATTERN, False, jobs)
+        assert result == [s.encode() for s in expected]
+
+    @pytest.mark.benchmark(group="find-medium")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_find_rust_numpy_medium(self, jobs, benchmark, test_data):
+        numpy = pytest.importorskip("numpy")
+        data, expected = test_data
+        out = numpy.empty(len(data), dtype=object)
+        benchmark(yurki.internal.find_regex_into, data, HANDLE, out, False, jobs)
+        assert out.tolist() == expected
+
     @pytest.mark.benchmark(group="find-medium")
     def test_find_python_medium(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_find_python, data, PATTERN)
+        result = benchmark(regex_find_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="find-medium")
+    def test_find_re2_medium(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_find_python, data, re2.compile(PATTERN))
         assert result == expected
 
 
@@ -96,11 +298,35 @@ class TestBenchFindLong:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_find_rust_long(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.find_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.find_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.benchmark(group="find-long")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_find_rust_bytes_long(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        data = [s.encode() for s in data]
+        result = benchmark(yurki.internal.find_regex_in_bytes, data, PATTERN, False, jobs)
+        assert result == [s.encode() for s in expected]
+
+    @pytest.mark.benchmark(group="find-long")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_find_rust_numpy_long(self, jobs, benchmark, test_data):
+        numpy = pytest.importorskip("numpy")
+        data, expected = test_data
+        out = numpy.empty(len(data), dtype=object)
+        benchmark(yurki.internal.find_regex_into, data, HANDLE, out, False, jobs)
+        assert out.tolist() == expected
+
     @pytest.mark.benchmark(group="find-long")
     def test_find_python_long(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_find_python, data, PATTERN)
+        result = benchmark(regex_find_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="find-long")
+    def test_find_re2_long(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_find_python, data, re2.compile(PATTERN))
         assert result == expected
@@ -1,4 +1,5 @@
 import re
+import array
 
 import pytest
 
@@ -7,24 +8,27 @@ import yurki
 
 PATTERN = r"(hi_how_are_you)|(hello)|(привет\d+)"
 JOBS = [1, 4]
+COMPILED = yurki.regexp.compile(PATTERN)
+HANDLE = yurki.internal.CompiledRegex(PATTERN)
+RE_COMPILED = re.compile(PATTERN)
 
 
 def regex_is_match_python(data, pattern):
-    compiled_pattern = re.compile(pattern)
-    return [bool(compiled_pattern.search(s)) for s in data]
+    search = pattern.search
+    return [bool(search(s)) for s in data]
 
 
 def generate_test_data(size):
     """Generate test data and expected results together."""
     data = [f"making_this_string_long_enough_to_test_hi_привет{i}" for i in range(size)]
-    expected = [True for _ in range(size)]
+    expected = [True] * size
     return data, expected
 
 
 def generate_no_match_data(size):
     """Generate test data with no matches."""
     data = [f"no_match_here_{i}" for i in range(size)]
-    expected = [False for _ in range(size)]
+    expected = [False] * size
     return data, expected
 
 
@@ -61,6 +65,48 @@ class TestIsMatch:
         result = yurki.regexp.is_match(data=data, pattern=PATTERN, jobs=jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_compiled_pattern(self, jobs):
+        data = ["привет123", "no_match", "hello_world"]
+        expected = [True, False, True]
+        result = yurki.regexp.is_match(data=data, pattern=COMPILED, jobs=jobs, inplace=False)
+        assert result == expected
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_is_match_mask(self, jobs):
+        data = ["привет123", "no_match", "hello_world"]
+        result = yurki.regexp.is_match_mask(data=data, pattern=PATTERN, jobs=jobs)
+        assert result == b"\x01\x00\x01"
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_is_match_mask_empty_list(self, jobs):
+        assert yurki.regexp.is_match_mask(data=[], pattern=COMPILED, jobs=jobs) == b""
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    @pytest.mark.parametrize("typecode", ["b", "B"])
+    def test_is_match_into(self, jobs, typecode):
+        data = ["привет123", "no_match", "hello_world"]
+        out = array.array(typecode, [7, 7, 7])
+        assert yurki.regexp.is_match_into(data=data, pattern=PATTERN, out=out, jobs=jobs) is None
+        assert out.tolist() == [1, 0, 1]
+
+    def test_is_match_into_bytearray(self):
+        out = bytearray(2)
+        yurki.regexp.is_match_into(data=["hello", "bye"], pattern=COMPILED, out=out)
+        assert out == b"\x01\x00"
+
+    def test_is_match_into_rejects_wrong_length(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.is_match_into(data=["hello"], pattern=PATTERN, out=bytearray(2))
+
+    def test_is_match_into_rejects_readonly(self):
+        with pytest.raises(TypeError):
+            yurki.regexp.is_match_into(data=["hello"], pattern=PATTERN, out=b"\x00")
+
+    def test_is_match_into_rejects_wide_items(self):
+        with pytest.raises(TypeError):
+            yurki.regexp.is_match_into(data=["hello"], pattern=PATTERN, out=array.array("i", [0]))
+
 
 class TestBenchIsMatchShort:
     @pytest.fixture
@@ -71,13 +117,35 @@ class TestBenchIsMatchShort:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_is_match_rust_short(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.is_match_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.is_match_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.benchmark(group="match-short")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_is_match_rust_mask_short(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        result = benchmark(yurki.internal.is_match_regex_bytes, data, HANDLE, False, jobs)
+        assert result == bytes(expected)
+
+    @pytest.mark.benchmark(group="match-short")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_is_match_rust_into_short(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        out = bytearray(len(data))
+        benchmark(yurki.internal.is_match_regex_into, data, HANDLE, out, False, jobs)
+        assert out == bytes(expected)
+
     @pytest.mark.benchmark(group="match-short")
     def test_is_match_python_short(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_is_match_python, data, PATTERN)
+        result = benchmark(regex_is_match_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="match-short")
+    def test_is_match_re2_short(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_is_match_python, data, re2.compile(PATTERN))
         assert result == expected
 
 
@@ -90,13 +158,35 @@ class TestBenchIsMatchMedium:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_is_match_rust_medium(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.is_match_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.is_match_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.benchmark(group="match-medium")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_is_match_rust_mask_medium(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        result = benchmark(yurki.internal.is_match_regex_bytes, data, HANDLE, False, jobs)
+        assert result == bytes(expected)
+
+    @pytest.mark.benchmark(group="match-medium")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_is_match_rust_into_medium(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        out = bytearray(len(data))
+        benchmark(yurki.internal.is_match_regex_into, data, HANDLE, out, False, jobs)
+        assert out == bytes(expected)
+
     @pytest.mark.benchmark(group="match-medium")
     def test_is_match_python_medium(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_is_match_python, data, PATTERN)
+        result = benchmark(regex_is_match_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="match-medium")
+    def test_is_match_re2_medium(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_is_match_python, data, re2.compile(PATTERN))
         assert result == expected
 
 
@@ -109,11 +199,33 @@ class TestBenchIsMatchLong:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_is_match_rust_long(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.is_match_regex_in_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.is_match_regex_in_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.benchmark(group="match-long")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_is_match_rust_mask_long(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        result = benchmark(yurki.internal.is_match_regex_bytes, data, HANDLE, False, jobs)
+        assert result == bytes(expected)
+
+    @pytest.mark.benchmark(group="match-long")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_is_match_rust_into_long(self, jobs, benchmark, test_data):
+        data, expected = test_data
+        out = bytearray(len(data))
+        benchmark(yurki.internal.is_match_regex_into, data, HANDLE, out, False, jobs)
+        assert out == bytes(expected)
+
     @pytest.mark.benchmark(group="match-long")
     def test_is_match_python_long(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_is_match_python, data, PATTERN)
+        result = benchmark(regex_is_match_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="match-long")
+    def test_is_match_re2_long(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_is_match_python, data, re2.compile(PATTERN))
         assert result == expected
@@ -1,4 +1,5 @@
 import re
+import sys
 
 import pytest
 
@@ -8,14 +9,24 @@ import yurki
 PATTERN = r"[Tt]est\s+\w{6,}"
 REPLACEMENT = "MATCHED"
 JOBS = [1, 4]
+COMPILED = yurki.regexp.compile(PATTERN)
+HANDLE = yurki.internal.CompiledRegex(PATTERN)
+RE_COMPILED = re.compile(PATTERN)
+MULTI_PATTERNS = ["some", "text", "test"]
+MULTI_REPLACEMENTS = ["SOME", "TEXT", "TEST"]
 
 
 def regex_replace_python(data, pattern, replacement, count=1):
-    compiled_pattern = re.compile(pattern)
-    if count == 0:
-        return [compiled_pattern.sub(replacement, s) for s in data]
-    else:
-        return [compiled_pattern.sub(replacement, s, count=count) for s in data]
+    sub = pattern.sub
+    return [sub(replacement, s, count) for s in data]
+
+
+def regex_replace_multi_python(data, patterns, replacements):
+    # Chained str.replace: one pass over each string per pattern
+    result = data
+    for pattern, replacement in zip(patterns, replacements):
+        result = [s.replace(pattern, replacement) for s in result]
+    return result
 
 
 def generate_test_data(size):
@@ -129,6 +140,19 @@ class TestReplace:
         )
         assert result == expected
 
+    @pytest.mark.parametrize("jobs", JOBS)
+    @pytest.mark.parametrize("pattern", [r"hello|world", r"hello|s", r"kelvin", r"[,;]"])
+    def test_case_insensitive_literals(self, jobs, pattern):
+        # ASCII folding must agree with Unicode folding: KELVIN SIGN, LONG S
+        data = ["Hello WORLD hello", "KELVIN Kelvin ſ s", "\u212aELVIN \u212aelvin", "\u017f \u017fs", "a,b;c", "none"]
+        expected = yurki.regexp.replace(data=data, pattern=f"(?i){pattern}", replacement="_", count=0)
+        result = yurki.regexp.replace(data=data, pattern=pattern, replacement="_", count=0, case=True, jobs=jobs)
+        assert result == expected
+        assert result == [re.sub(pattern, "_", s, flags=re.I) for s in data]
+        assert yurki.regexp.split(data=data, pattern=pattern, case=True, jobs=jobs) == [
+            re.split(f"(?i){pattern}", s) for s in data
+        ]
+
     @pytest.mark.parametrize("jobs", JOBS)
     def test_complex_regex_patterns(self, jobs):
         # Email pattern replacement
@@ -213,6 +237,149 @@ class TestReplace:
         )
         assert result == expected
 
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_compiled_pattern(self, jobs):
+        data, expected = generate_test_data(10)
+        result = yurki.regexp.replace(
+            data=data, pattern=COMPILED, replacement=REPLACEMENT, count=1, jobs=jobs, inplace=False
+        )
+        assert result == expected
+
+    def test_invalid_pattern(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.replace(data=["a"], pattern=r"(unclosed", replacement="b")
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_literal_alternation_groups(self, jobs):
+        data = ["foo bar baz", "no match"]
+        assert yurki.regexp.replace(data=data, pattern=r"(foo)|ba\w", replacement="_", count=0, jobs=jobs) == [
+            "_ _ _",
+            "no match",
+        ]
+        assert yurki.regexp.replace(data=data, pattern=r"(foo)|(bar)", replacement="<$1$2>", count=0, jobs=jobs) == [
+            "<foo> <bar> baz",
+            "no match",
+        ]
+        assert yurki.regexp.replace(data=data, pattern=r"(foo)|(bar)|a\.", replacement="$$", count=2, jobs=jobs) == [
+            "$ $ baz",
+            "no match",
+        ]
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    @pytest.mark.parametrize("pattern", [PATTERN, r"hello|привет"])
+    def test_unchanged_rows_reuse_input(self, jobs, pattern):
+        data = ["nothing to see", "test string here", "привет мир"]
+        originals = list(data)
+        result = yurki.regexp.replace(data=data, pattern=pattern, replacement=REPLACEMENT, jobs=jobs)
+        assert result[0] is originals[0]
+        assert result == [regex_replace_python([s], re.compile(pattern), REPLACEMENT)[0] for s in originals]
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_inplace_returns_data(self, jobs):
+        data, expected = generate_test_data(10)
+        data.append("nothing to see")
+        expected.append("nothing to see")
+        result = yurki.regexp.replace(data=data, pattern=PATTERN, replacement=REPLACEMENT, jobs=jobs, inplace=True)
+        assert result is data
+        assert data == expected
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_inplace_releases_replaced_items(self, jobs):
+        item = "".join(["test string ", "here"])
+        data = [item] * 8
+        before = sys.getrefcount(item)
+        yurki.regexp.replace(data=data, pattern=PATTERN, replacement=REPLACEMENT, jobs=jobs, inplace=True)
+        assert sys.getrefcount(item) == before - 8
+
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_replace_parallel_chunks(self, inplace):
+        # Well over the minimum chunk size, so jobs=4 actually runs several workers
+        data, expected = generate_test_data(50_000)
+        data[::7] = ["nothing to see"] * len(data[::7])
+        expected[::7] = ["nothing to see"] * len(expected[::7])
+        result = yurki.regexp.replace(data=data, pattern=PATTERN, replacement=REPLACEMENT, jobs=4, inplace=inplace)
+        assert result == expected
+        assert (result is data) == inplace
+
+    def test_inplace_parallel_releases_replaced_items(self):
+        item = "".join(["some text with test string ", "and more"])
+        data = [item] * 50_000
+        before = sys.getrefcount(item)
+        yurki.regexp.replace(data=data, pattern=PATTERN, replacement=REPLACEMENT, jobs=4, inplace=True)
+        assert sys.getrefcount(item) == before - 50_000
+        assert data == ["some text with MATCHED and more"] * 50_000
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    @pytest.mark.parametrize("pattern", [PATTERN, r"\btest\b", r"(?:foo|bar)baz"])
+    def test_rows_without_required_literal(self, jobs, pattern):
+        data = ["nothing to see", "a test string here", "Test string content", "foobaz barbaz", ""]
+        compiled = re.compile(pattern)
+        assert yurki.regexp.replace(data=data, pattern=pattern, replacement="X", count=0, jobs=jobs) == [
+            compiled.sub("X", s) for s in data
+        ]
+        assert yurki.regexp.is_match(data=data, pattern=pattern, jobs=jobs) == [bool(compiled.search(s)) for s in data]
+        assert yurki.regexp.split(data=data, pattern=pattern, jobs=jobs) == [compiled.split(s) for s in data]
+
+    def test_unchanged_str_subclass(self):
+        class Text(str):
+            pass
+
+        result = yurki.regexp.replace(data=[Text("nothing")], pattern=PATTERN, replacement=REPLACEMENT)
+        assert result == ["nothing"]
+        assert type(result[0]) is str
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_replace_bytes(self, jobs):
+        data = [b"test string here", b"\xff test string", b"nothing"]
+        result = yurki.regexp.replace_bytes(data=data, pattern=PATTERN, replacement=b"MATCHED", jobs=jobs)
+        assert result == [b"MATCHED here", b"\xff MATCHED", b"nothing"]
+        assert result[-1] is data[-1]
+
+    def test_replace_bytes_groups(self):
+        result = yurki.regexp.replace_bytes(data=[b"a1b2c3"], pattern=r"(\w)(\d)", replacement=b"$2$1", count=0)
+        assert result == [b"1a2b3c"]
+
+    def test_replace_bytes_compiled(self):
+        pairs = yurki.regexp.compile(r"(\w)(\d)")
+        assert pairs.replace_bytes([b"a1b2c3"], b"$2$1", count=0) == [b"1a2b3c"]
+        assert yurki.regexp.replace_bytes(data=[b"a1b2"], pattern=pairs, replacement=b"_") == [b"_b2"]
+
+
+class TestReplaceMulti:
+    @pytest.mark.parametrize("jobs", JOBS)
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_replace_multi(self, jobs, inplace):
+        data = ["cat and dog", "привет мир", "nothing here"]
+        expected = ["dog and cat", "hello world", "nothing here"]
+        patterns = ["cat", "dog", "привет", "мир"]
+        replacements = ["dog", "cat", "hello", "world"]
+        result = yurki.regexp.replace_multi(
+            data=data, patterns=patterns, replacements=replacements, jobs=jobs, inplace=inplace
+        )
+        assert result == expected
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_empty_list(self, jobs):
+        assert yurki.regexp.replace_multi(data=[], patterns=["a"], replacements=["b"], jobs=jobs) == []
+
+    def test_leftmost_first(self):
+        # Same preference order as the regex alternation ab|abc|b
+        data = ["abcb"]
+        expected = yurki.regexp.replace(data=data, pattern=r"ab|abc|b", replacement="_", count=0)
+        assert yurki.regexp.replace_multi(data=data, patterns=["ab", "abc", "b"], replacements=["_"] * 3) == expected
+
+    def test_replacements_are_literal(self):
+        result = yurki.regexp.replace_multi(data=["a.b"], patterns=["."], replacements=["$1"])
+        assert result == ["a$1b"]
+
+    def test_rejects_length_mismatch(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.replace_multi(data=["a"], patterns=["a", "b"], replacements=["c"])
+
+    def test_rejects_empty_pattern(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.replace_multi(data=["a"], patterns=[""], replacements=["c"])
+
 
 class TestBenchReplaceShort:
     @pytest.fixture
@@ -224,16 +391,36 @@ class TestBenchReplaceShort:
     def test_replace_rust_short(self, jobs, benchmark, test_data):
         data, expected = test_data
         result = benchmark(
-            yurki.internal.replace_regexp_in_string, data, PATTERN, REPLACEMENT, 1, False, jobs, inplace=False
+            yurki.internal.replace_regexp_in_string, data, HANDLE, REPLACEMENT, 1, False, jobs, inplace=False
         )
         assert result == expected
 
     @pytest.mark.benchmark(group="replace-short")
     def test_replace_python_short(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_replace_python, data, PATTERN, REPLACEMENT, 1)
+        result = benchmark(regex_replace_python, data, RE_COMPILED, REPLACEMENT, 1)
         assert result == expected
 
+    @pytest.mark.benchmark(group="replace-short")
+    def test_replace_re2_short(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_replace_python, data, re2.compile(PATTERN), REPLACEMENT, 1)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="replace-multi-short")
+    @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
+    def test_replace_rust_multi_short(self, jobs, benchmark, test_data):
+        data, _ = test_data
+        result = benchmark(yurki.internal.replace_multi_in_string, data, MULTI_PATTERNS, MULTI_REPLACEMENTS, jobs)
+        assert result == regex_replace_multi_python(data, MULTI_PATTERNS, MULTI_REPLACEMENTS)
+
+    @pytest.mark.benchmark(group="replace-multi-short")
+    def test_replace_python_multi_short(self, benchmark, test_data):
+        data, _ = test_data
+        result = benchmark(regex_replace_multi_python, data, MULTI_PATTERNS, MULTI_REPLACEMENTS)
+        assert result[0] == "SOME TEXT with TEST string and more TEST content 0"
+
 
 class TestBenchReplaceMedium:
     @pytest.fixture
@@ -245,14 +432,21 @@ class TestBenchReplaceMedium:
     def test_replace_rust_medium(self, jobs, benchmark, test_data):
         data, expected = test_data
         result = benchmark(
-            yurki.internal.replace_regexp_in_string, data, PATTERN, REPLACEMENT, 1, False, jobs, inplace=False
+            yurki.internal.replace_regexp_in_string, data, HANDLE, REPLACEMENT, 1, False, jobs, inplace=False
         )
         assert result == expected
 
     @pytest.mark.benchmark(group="replace-medium")
     def test_replace_python_medium(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_replace_python, data, PATTERN, REPLACEMENT, 1)
+        result = benchmark(regex_replace_python, data, RE_COMPILED, REPLACEMENT, 1)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="replace-medium")
+    def test_replace_re2_medium(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_replace_python, data, re2.compile(PATTERN), REPLACEMENT, 1)
         assert result == expected
 
 
@@ -266,12 +460,19 @@ class TestBenchReplaceLong:
     def test_replace_rust_long(self, jobs, benchmark, test_data):
         data, expected = test_data
         result = benchmark(
-            yurki.internal.replace_regexp_in_string, data, PATTERN, REPLACEMENT, 1, False, jobs, inplace=False
+            yurki.internal.replace_regexp_in_string, data, HANDLE, REPLACEMENT, 1, False, jobs, inplace=False
         )
         assert result == expected
 
     @pytest.mark.benchmark(group="replace-long")
     def test_replace_python_long(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_replace_python, data, PATTERN, REPLACEMENT, 1)
+        result = benchmark(regex_replace_python, data, RE_COMPILED, REPLACEMENT, 1)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="replace-long")
+    def test_replace_re2_long(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_replace_python, data, re2.compile(PATTERN), REPLACEMENT, 1)
         assert result == expected
@@ -7,11 +7,14 @@ import yurki
 
 PATTERN = r"[,;]"
 JOBS = [1, 4]
+COMPILED = yurki.regexp.compile(PATTERN)
+HANDLE = yurki.internal.CompiledRegex(PATTERN)
+RE_COMPILED = re.compile(PATTERN)
 
 
 def regex_split_python(data, pattern):
-    compiled_pattern = re.compile(pattern)
-    return [compiled_pattern.split(s) for s in data]
+    split = pattern.split
+    return [split(s) for s in data]
 
 
 def generate_test_data(size):
@@ -72,6 +75,52 @@ class TestSplit:
         result = yurki.regexp.split(data=data, pattern=pattern, jobs=jobs, inplace=False)
         assert result == expected
 
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_compiled_pattern(self, jobs):
+        data, expected = generate_test_data(10)
+        result = yurki.regexp.split(data=data, pattern=COMPILED, jobs=jobs, inplace=False)
+        assert result == expected
+
+    def test_invalid_pattern(self):
+        with pytest.raises(ValueError):
+            yurki.regexp.split(data=["a,b"], pattern=r"[unclosed")
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            ",",
+            r"\t",
+            "[,;:]",
+            ",|;",
+            ", ",
+            "…",
+            r"a\.",
+            r"[,;:|]",
+            r"[ \t,;:|-]",
+            "[^,]",
+        ],
+    )
+    def test_literal_delimiters(self, jobs, pattern):
+        data = ["a,b;c", "", ",", "a, b,, c;", "x…y…", "a.a\tb", "б,в;г|д:е"]
+        expected = [re.split(pattern, s) for s in data]
+        assert yurki.regexp.split(data=data, pattern=pattern, jobs=jobs) == expected
+
+    @pytest.mark.parametrize("jobs", JOBS)
+    def test_split_bytes(self, jobs):
+        data = [b"a,b;c", b"", b"\xff,x", b"no delimiter"]
+        result = yurki.regexp.split_bytes(data=data, pattern=PATTERN, jobs=jobs)
+        assert result == [re.split(PATTERN.encode(), s) for s in data]
+        assert result[-1][0] is data[-1]
+
+    def test_split_bytes_compiled(self):
+        data = [b"a,b;c", b"\xff,x"]
+        assert yurki.regexp.split_bytes(data=data, pattern=COMPILED) == [re.split(PATTERN.encode(), s) for s in data]
+        assert COMPILED.split_bytes(data) == [[b"a", b"b", b"c"], [b"\xff", b"x"]]
+
+    def test_literal_delimiter_case_insensitive(self):
+        assert yurki.regexp.split(data=["aXbxc"], pattern="x", case=True) == ["a", "b", "c"]
+
 
 class TestBenchSplitShort:
     @pytest.fixture
@@ -82,13 +131,20 @@ class TestBenchSplitShort:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_split_rust_short(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.split_by_regexp_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.split_by_regexp_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
     @pytest.mark.benchmark(group="split-short")
     def test_split_python_short(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_split_python, data, PATTERN)
+        result = benchmark(regex_split_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="split-short")
+    def test_split_re2_short(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_split_python, data, re2.compile(PATTERN))
         assert result == expected
 
 
@@ -101,13 +157,20 @@ class TestBenchSplitMedium:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_split_rust_medium(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.split_by_regexp_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.split_by_regexp_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
     @pytest.mark.benchmark(group="split-medium")
     def test_split_python_medium(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_split_python, data, PATTERN)
+        result = benchmark(regex_split_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="split-medium")
+    def test_split_re2_medium(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_split_python, data, re2.compile(PATTERN))
         assert result == expected
 
 
@@ -120,11 +183,18 @@ class TestBenchSplitLong:
     @pytest.mark.parametrize("jobs", JOBS, ids=lambda j: f"jobs={j}")
     def test_split_rust_long(self, jobs, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(yurki.internal.split_by_regexp_string, data, PATTERN, False, jobs, inplace=False)
+        result = benchmark(yurki.internal.split_by_regexp_string, data, HANDLE, False, jobs, inplace=False)
         assert result == expected
 
     @pytest.mark.benchmark(group="split-long")
     def test_split_python_long(self, benchmark, test_data):
         data, expected = test_data
-        result = benchmark(regex_split_python, data, PATTERN)
+        result = benchmark(regex_split_python, data, RE_COMPILED)
+        assert result == expected
+
+    @pytest.mark.benchmark(group="split-long")
+    def test_split_re2_long(self, benchmark, test_data):
+        re2 = pytest.importorskip("re2")
+        data, expected = test_data
+        result = benchmark(regex_split_python, data, re2.compile(PATTERN))
         assert result == expected
@@ -17,7 +17,7 @@ Examples:
     ['hi world', 'test 123']
 """
 
-import yurki.regexp as regexp
+from . import regexp
 from .yurki import internal
 
 
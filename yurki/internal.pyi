@@ -1,10 +1,48 @@
 """Type stubs for yurki.internal module (Rust implementation)."""
 
 from typing import List
+from collections.abc import Buffer
+
+class CompiledRegex:
+    """Regex compiled once on the Rust side and reusable across calls."""
+
+    def __init__(self, pattern: str, case: bool = False) -> None:
+        """Compile a regex pattern.
+
+        Args:
+            pattern: Regular expression pattern
+            case: Case-insensitive matching when True
+
+        Raises:
+            ValueError: If the pattern is not a valid regex
+        """
+        ...
+    @property
+    def pattern(self) -> str:
+        """Source pattern string."""
+        ...
+    @property
+    def case(self) -> bool:
+        """Whether the pattern was compiled case-insensitive."""
+        ...
+
+def precompiled_regex(name: str) -> CompiledRegex:
+    """Get a pattern embedded as a dense DFA at build time.
+
+    Args:
+        name: Name of the builtin pattern
+
+    Returns:
+        Compiled pattern backed by the embedded DFA
+
+    Raises:
+        ValueError: If no builtin pattern has this name
+    """
+    ...
 
 def find_regex_in_string(
     list: List[str],
-    pattern: str,
+    pattern: str | CompiledRegex,
     case: bool = False,
     jobs: int = 1,
     inplace: bool = False,
@@ -13,8 +51,8 @@ def find_regex_in_string(
 
     Args:
         list: List of strings to process
-        pattern: Regular expression pattern
-        case: Case-insensitive matching when True
+        pattern: Regular expression pattern or compiled pattern
+        case: Case-insensitive matching when True (must be False for compiled patterns)
         jobs: Number of parallel workers
         inplace: Modify original list when True
 
@@ -23,9 +61,88 @@ def find_regex_in_string(
     """
     ...
 
+def find_regex_into(
+    list: List[str],
+    pattern: str | CompiledRegex,
+    out: Buffer,
+    case: bool = False,
+    jobs: int = 1,
+) -> None:
+    """Write the first regex match in each string into an object buffer.
+
+    Args:
+        list: List of strings to process
+        pattern: Regular expression pattern or compiled pattern
+        out: Writable C-contiguous buffer of objects (e.g. a numpy object array), one per string
+        case: Case-insensitive matching when True (must be False for compiled patterns)
+        jobs: Number of parallel workers
+    """
+    ...
+
+def find_regex_in_bytes(
+    list: List[bytes],
+    pattern: str | CompiledRegex,
+    case: bool = False,
+    jobs: int = 1,
+) -> List[bytes]:
+    """Find first regex match in each bytes object.
+
+    Args:
+        list: List of bytes objects to process
+        pattern: Regular expression pattern or compiled pattern
+        case: Case-insensitive matching when True (must be False for compiled patterns)
+        jobs: Number of parallel workers
+
+    Returns:
+        List of matched bytes (empty bytes if no match)
+    """
+    ...
+
+def split_by_regexp_bytes(
+    list: List[bytes],
+    pattern: str | CompiledRegex,
+    case: bool = False,
+    jobs: int = 1,
+) -> List[List[bytes]]:
+    """Split bytes objects by regex delimiter.
+
+    Args:
+        list: List of bytes objects to process
+        pattern: Regular expression pattern or compiled pattern for splitting
+        case: Case-insensitive matching when True (must be False for compiled patterns)
+        jobs: Number of parallel workers
+
+    Returns:
+        List of lists containing split parts
+    """
+    ...
+
+def replace_regexp_in_bytes(
+    list: List[bytes],
+    pattern: str | CompiledRegex,
+    replacement: bytes,
+    count: int = 1,
+    case: bool = False,
+    jobs: int = 1,
+) -> List[bytes]:
+    """Replace regex matches in bytes objects.
+
+    Args:
+        list: List of bytes objects to process
+        pattern: Regular expression pattern or compiled pattern
+        replacement: Replacement bytes (supports backreferences $1, $2, etc.)
+        count: Maximum number of replacements per item (0 for all)
+        case: Case-insensitive matching when True (must be False for compiled patterns)
+        jobs: Number of parallel workers
+
+    Returns:
+        List of bytes with replacements applied
+    """
+    ...
+
 def is_match_regex_in_string(
     list: List[str],
-    pattern: str,
+    pattern: str | CompiledRegex,
     case: bool = False,
     jobs: int = 1,
     inplace: bool = False,
@@ -34,8 +151,8 @@ def is_match_regex_in_string(
 
     Args:
         list: List of strings to process
-        pattern: Regular expression pattern
-        case: Case-insensitive matching when True
+        pattern: Regular expression pattern or compiled pattern
+        case: Case-insensitive matching when True (must be False for compiled patterns)
         jobs: Number of parallel workers
         inplace: Modify original list when True
 
@@ -44,9 +161,46 @@ def is_match_regex_in_string(
     """
     ...
 
+def is_match_regex_bytes(
+    list: List[str],
+    pattern: str | CompiledRegex,
+    case: bool = False,
+    jobs: int = 1,
+) -> bytes:
+    """Check if each string matches regex pattern, as a byte mask.
+
+    Args:
+        list: List of strings to process
+        pattern: Regular expression pattern or compiled pattern
+        case: Case-insensitive matching when True (must be False for compiled patterns)
+        jobs: Number of parallel workers
+
+    Returns:
+        Bytes with 1 for each matching string and 0 otherwise
+    """
+    ...
+
+def is_match_regex_into(
+    list: List[str],
+    pattern: str | CompiledRegex,
+    out: Buffer,
+    case: bool = False,
+    jobs: int = 1,
+) -> None:
+    """Write 1/0 match flags for each string into a buffer.
+
+    Args:
+        list: List of strings to process
+        pattern: Regular expression pattern or compiled pattern
+        out: Writable C-contiguous buffer of one-byte items (u8, i8 or bool), one per string
+        case: Case-insensitive matching when True (must be False for compiled patterns)
+        jobs: Number of parallel workers
+    """
+    ...
+
 def capture_regex_in_string(
     list: List[str],
-    pattern: str,
+    pattern: str | CompiledRegex,
     case: bool = False,
     jobs: int = 1,
     inplace: bool = False,
@@ -55,8 +209,8 @@ def capture_regex_in_string(
 
     Args:
         list: List of strings to process
-        pattern: Regular expression pattern with capture groups
-        case: Case-insensitive matching when True
+        pattern: Regular expression pattern with capture groups or compiled pattern
+        case: Case-insensitive matching when True (must be False for compiled patterns)
         jobs: Number of parallel workers
         inplace: Modify original list when True
 
@@ -65,9 +219,49 @@ def capture_regex_in_string(
     """
     ...
 
+def capture_regex_in_string_flat(
+    list: List[str],
+    pattern: str | CompiledRegex,
+    case: bool = False,
+    jobs: int = 1,
+) -> tuple[List[int], List[str]]:
+    """Capture regex groups from all strings into one flat list.
+
+    Args:
+        list: List of strings to process
+        pattern: Regular expression pattern with capture groups or compiled pattern
+        case: Case-insensitive matching when True (must be False for compiled patterns)
+        jobs: Number of parallel workers
+
+    Returns:
+        Tuple of (offsets, values) where values[offsets[i]:offsets[i + 1]] holds
+        [full_match, group1, group2, ...] for string i, empty when it doesn't match
+    """
+    ...
+
+def capture_regex_in_string_columns(
+    list: List[str],
+    pattern: str | CompiledRegex,
+    case: bool = False,
+    jobs: int = 1,
+) -> List[List[str]]:
+    """Capture regex groups from all strings, one list per group.
+
+    Args:
+        list: List of strings to process
+        pattern: Regular expression pattern with capture groups or compiled pattern
+        case: Case-insensitive matching when True (must be False for compiled patterns)
+        jobs: Number of parallel workers
+
+    Returns:
+        List of captures_len lists, each as long as the input: columns[j][i] is
+        group j of string i, empty string when it doesn't match
+    """
+    ...
+
 def split_by_regexp_string(
     list: List[str],
-    pattern: str,
+    pattern: str | CompiledRegex,
     case: bool = False,
     jobs: int = 1,
     inplace: bool = False,
@@ -76,8 +270,8 @@ def split_by_regexp_string(
 
     Args:
         list: List of strings to process
-        pattern: Regular expression pattern for splitting
-        case: Case-insensitive matching when True
+        pattern: Regular expression pattern for splitting or compiled pattern
+        case: Case-insensitive matching when True (must be False for compiled patterns)
         jobs: Number of parallel workers
         inplace: Modify original list when True
 
@@ -88,7 +282,7 @@ def split_by_regexp_string(
 
 def replace_regexp_in_string(
     list: List[str],
-    pattern: str,
+    pattern: str | CompiledRegex,
     replacement: str,
     count: int = 1,
     case: bool = False,
@@ -99,10 +293,10 @@ def replace_regexp_in_string(
 
     Args:
         list: List of strings to process
-        pattern: Regular expression pattern
+        pattern: Regular expression pattern or compiled pattern
         replacement: Replacement string (supports backreferences $1, $2, etc.)
         count: Maximum number of replacements per string (0 for all)
-        case: Case-insensitive matching when True
+        case: Case-insensitive matching when True (must be False for compiled patterns)
         jobs: Number of parallel workers
         inplace: Modify original list when True
 
@@ -110,3 +304,24 @@ def replace_regexp_in_string(
         List of strings with replacements applied
     """
     ...
+
+def replace_multi_in_string(
+    list: List[str],
+    patterns: List[str],
+    replacements: List[str],
+    jobs: int = 1,
+    inplace: bool = False,
+) -> List[str]:
+    """Replace literal strings in one Aho-Corasick pass.
+
+    Args:
+        list: List of strings to process
+        patterns: Non-empty literal strings to search for
+        replacements: Replacement for each pattern (no backreferences)
+        jobs: Number of parallel workers
+        inplace: Modify original list when True
+
+    Returns:
+        List of strings with every occurrence replaced
+    """
+    ...
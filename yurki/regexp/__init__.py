@@ -1,52 +1,344 @@
 import os
+import typing
+import functools
+from collections.abc import Buffer
 
-import yurki
+from yurki.yurki import internal
 
 
-def __auto_select_jobs(data: list[str]) -> int:
-    if len(data) < 1000:
+if typing.TYPE_CHECKING:
+    import numpy
+
+
+# CPUs this process may run on (taskset, cgroup cpusets), not all the machine has
+if hasattr(os, "sched_getaffinity"):
+    _CPU_COUNT = len(os.sched_getaffinity(0)) or 1
+else:
+    _CPU_COUNT = os.cpu_count() or 1
+
+# Auto-selected jobs: estimated input size that runs serially, and per worker
+_SERIAL_BYTES = 64_000
+_BYTES_PER_JOB = 256_000
+
+
+def _auto_select_jobs(data: list[str]) -> int:
+    if len(data) < 4:
         return 1
-    else:
-        return os.cpu_count()
+
+    # Estimate the total input size from up to 64 evenly spaced items
+    step = max(1, len(data) // 64)
+    sample = data[::step][:64]
+    total = sum(map(len, sample)) * len(data) // len(sample)
+
+    if total < _SERIAL_BYTES:
+        return 1
+    return min(_CPU_COUNT, max(1, total // _BYTES_PER_JOB))
+
+
+class Pattern:
+    """Compiled regex pattern with the `yurki.regexp` operations as methods.
+
+    Created by `compile` and `precompiled`. Methods take the same arguments as the
+    module-level functions minus `pattern` and `case`, which are fixed here.
+
+    Examples:
+        >>> digits = yurki.regexp.compile(r'\\d+')
+        >>> digits.find(['hello world', 'test 123'])
+        ['', '123']
+    """
+
+    __slots__ = ("_compiled",)
+
+    def __init__(self, pattern: str, case: bool = False) -> None:
+        self._compiled = internal.CompiledRegex(pattern, case)
+
+    @classmethod
+    def _from_compiled(cls, compiled: "internal.CompiledRegex") -> "Pattern":
+        obj = cls.__new__(cls)
+        obj._compiled = compiled
+        return obj
+
+    @property
+    def pattern(self) -> str:
+        """Source pattern string."""
+        return self._compiled.pattern
+
+    @property
+    def case(self) -> bool:
+        """Whether the pattern is case-insensitive."""
+        return self._compiled.case
+
+    def __repr__(self) -> str:
+        return f"Pattern({self.pattern!r}, case={self.case})"
+
+    def find(
+        self,
+        data: list[str],
+        jobs: int | None = None,
+        inplace: bool = False,
+        output: typing.Literal["list", "numpy"] = "list",
+    ) -> "list[str] | numpy.ndarray":
+        """Find the first match in each string, see `yurki.regexp.find`."""
+        if output not in ("list", "numpy"):
+            raise ValueError(f"output must be 'list' or 'numpy', not {output!r}")
+        if output == "numpy" and inplace:
+            raise ValueError("cannot modify the list in place with output='numpy'")
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        if output == "numpy":
+            import numpy
+
+            out = numpy.empty(len(data), dtype=object)
+            internal.find_regex_into(data, self._compiled, out, False, jobs)
+            return out
+        return internal.find_regex_in_string(data, self._compiled, False, jobs, inplace)
+
+    def is_match(self, data: list[str], jobs: int | None = None, inplace: bool = False) -> list[bool]:
+        """Check if each string matches, see `yurki.regexp.is_match`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.is_match_regex_in_string(data, self._compiled, False, jobs, inplace)
+
+    def is_match_mask(self, data: list[str], jobs: int | None = None) -> bytes:
+        """Match flags as bytes, see `yurki.regexp.is_match_mask`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.is_match_regex_bytes(data, self._compiled, False, jobs)
+
+    def is_match_into(self, data: list[str], out: Buffer, jobs: int | None = None) -> None:
+        """Write match flags into `out`, see `yurki.regexp.is_match_into`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        internal.is_match_regex_into(data, self._compiled, out, False, jobs)
+
+    def capture(self, data: list[str], jobs: int | None = None, inplace: bool = False) -> list[list[str]]:
+        """Capture groups from each string, see `yurki.regexp.capture`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.capture_regex_in_string(data, self._compiled, False, jobs, inplace)
+
+    def capture_flat(self, data: list[str], jobs: int | None = None) -> tuple[list[int], list[str]]:
+        """Capture groups into one flat list, see `yurki.regexp.capture_flat`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.capture_regex_in_string_flat(data, self._compiled, False, jobs)
+
+    def capture_columns(self, data: list[str], jobs: int | None = None) -> list[list[str]]:
+        """Capture groups into one list per group, see `yurki.regexp.capture_columns`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.capture_regex_in_string_columns(data, self._compiled, False, jobs)
+
+    def split(self, data: list[str], jobs: int | None = None, inplace: bool = False) -> list[list[str]]:
+        """Split each string on matches, see `yurki.regexp.split`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.split_by_regexp_string(data, self._compiled, False, jobs, inplace)
+
+    def replace(
+        self,
+        data: list[str],
+        replacement: str,
+        count: int = 1,
+        jobs: int | None = None,
+        inplace: bool = False,
+    ) -> list[str]:
+        """Replace matches in each string, see `yurki.regexp.replace`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.replace_regexp_in_string(data, self._compiled, replacement, count, False, jobs, inplace)
+
+    def find_bytes(self, data: list[bytes], jobs: int | None = None) -> list[bytes]:
+        """Find the first match in each bytes object, see `yurki.regexp.find_bytes`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.find_regex_in_bytes(data, self._compiled, False, jobs)
+
+    def split_bytes(self, data: list[bytes], jobs: int | None = None) -> list[list[bytes]]:
+        """Split each bytes object on matches, see `yurki.regexp.split_bytes`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.split_by_regexp_bytes(data, self._compiled, False, jobs)
+
+    def replace_bytes(
+        self,
+        data: list[bytes],
+        replacement: bytes,
+        count: int = 1,
+        jobs: int | None = None,
+    ) -> list[bytes]:
+        """Replace matches in each bytes object, see `yurki.regexp.replace_bytes`."""
+        if jobs is None:
+            jobs = _auto_select_jobs(data)
+
+        return internal.replace_regexp_in_bytes(data, self._compiled, replacement, count, False, jobs)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(pattern: str, case: bool) -> Pattern:
+    return Pattern(pattern, case)
+
+
+# Delimiters and tokens common enough to compile at import: their first call is
+# as cheap as any later one, and they never compete for `_compile_cached` slots
+_PRECOMPILED = {p: Pattern(p) for p in (r"[,;]", r"\s+", r"\d+", r"\w+")}
+
+
+def _compile(pattern: str, case: bool) -> Pattern:
+    if not case and (hot := _PRECOMPILED.get(pattern)) is not None:
+        return hot
+    return _compile_cached(pattern, case)
+
+
+def _resolve_pattern(pattern: "str | Pattern", case: bool) -> Pattern:
+    # Pattern strings are compiled once and reused across calls, like `re`'s cache
+    if isinstance(pattern, str):
+        return _compile(pattern, case)
+    if not isinstance(pattern, Pattern):
+        raise TypeError(f"pattern must be str or Pattern, not {type(pattern).__name__}")
+    if case:
+        raise ValueError("cannot process case argument with a compiled pattern")
+    return pattern
+
+
+def compile(pattern: str, case: bool = False) -> Pattern:
+    """Compile a regex pattern once for reuse across calls.
+
+    Args:
+        pattern: Regular expression pattern to compile
+        case: Whether to enable case-insensitive matching, same as a leading `(?i)`. Defaults to False
+
+    Returns:
+        `Pattern` accepted by every `yurki.regexp` function that takes a pattern
+        string, with those functions as methods. Its flags are fixed at compile time.
+
+    Examples:
+        >>> hello = yurki.regexp.compile(r'hello', case=True)
+        >>> yurki.regexp.find(['Hello world'], hello)
+        ['Hello']
+        >>> hello.find(['Hello world'])
+        ['Hello']
+    """
+    return _compile(pattern, case)
+
+
+def precompiled(name: str) -> Pattern:
+    """Get a pattern that was compiled to a DFA when yurki was built.
+
+    Builtin patterns skip regex compilation entirely: `find` and `is_match`
+    search the embedded DFA directly.
+
+    Args:
+        name: Name of the builtin pattern. Available names:
+            - "hi_privet": r"(hi_how_are_you)|(hello)|(привет\\d+)"
+
+    Returns:
+        Compiled pattern usable wherever `compile` results are accepted.
+
+    Raises:
+        ValueError: If no builtin pattern has this name.
+
+    Examples:
+        >>> yurki.regexp.find(['say привет42'], yurki.regexp.precompiled('hi_privet'))
+        ['привет42']
+    """
+    return Pattern._from_compiled(internal.precompiled_regex(name))
 
 
 def find(
-    data: list[str], pattern: str, case: bool = False, jobs: int | None = None, inplace: bool = False
-) -> list[str]:
+    data: list[str],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+    inplace: bool = False,
+    output: typing.Literal["list", "numpy"] = "list",
+) -> "list[str] | numpy.ndarray":
     """Find the first regex match in each string.
 
     Args:
         data: List of strings to search in
-        pattern: Regular expression pattern to search for
+        pattern: Regular expression pattern to search for, or a compiled pattern
         case: Whether to enable case-insensitive matching. Defaults to False
         jobs: Number of parallel jobs to use. Auto-selects based on data size if None
         inplace: Whether to modify the original list. Defaults to False
+        output: "list" for a list, or "numpy" for a numpy `object` array filled
+            directly from Rust, ready for numpy/pandas without another copy.
+            Defaults to "list"
 
     Returns:
         List of strings containing the first match found in each input string.
         Empty strings are returned for strings with no matches.
 
+    Raises:
+        ValueError: If `output` is unknown, or "numpy" together with `inplace`.
+
     Examples:
         >>> yurki.regexp.find(['hello world', 'test 123'], r'\\d+')
         ['', '123']
 
         >>> yurki.regexp.find(['Hello', 'hello'], r'hello', case=True)
         ['Hello', 'hello']
+
+        >>> yurki.regexp.find(['hello world', 'test 123'], r'\\d+', output='numpy')
+        array(['', '123'], dtype=object)
     """
-    if jobs is None:
-        jobs = __auto_select_jobs(data)
+    return _resolve_pattern(pattern, case).find(data, jobs, inplace, output)
+
+
+def find_bytes(
+    data: list[bytes],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+) -> list[bytes]:
+    """Find the first regex match in each bytes object.
+
+    Works on raw bytes, so inputs such as log lines don't need decoding to `str`
+    first. Classes (``\\d``, ``\\w``, ``\\b``, ...) and case folding are ASCII-only,
+    like a `bytes` pattern in `re`, unless the pattern asks for Unicode with ``(?u)``
+    or a class such as ``\\p{L}``. The pattern is compiled and cached like the `str`
+    functions' patterns, so it must also be valid for `find`.
+
+    Args:
+        data: List of bytes objects to search in
+        pattern: Regular expression pattern to search for, or a compiled pattern
+        case: Whether to enable case-insensitive matching. Defaults to False
+        jobs: Number of parallel jobs to use. Auto-selects based on data size if None
+
+    Returns:
+        List of bytes containing the first match found in each input.
+        Empty bytes are returned for inputs with no matches.
 
-    return yurki.internal.find_regex_in_string(data, pattern, case, jobs, inplace)
+    Examples:
+        >>> yurki.regexp.find_bytes([b'GET /index 200', b'no status'], r'\\d{3}')
+        [b'200', b'']
+    """
+    return _resolve_pattern(pattern, case).find_bytes(data, jobs)
 
 
 def is_match(
-    data: list[str], pattern: str, case: bool = False, jobs: int | None = None, inplace: bool = False
+    data: list[str],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+    inplace: bool = False,
 ) -> list[bool]:
     """Check if each string matches the regex pattern.
 
     Args:
         data: List of strings to test
-        pattern: Regular expression pattern to match against
+        pattern: Regular expression pattern to match against, or a compiled pattern
         case: Whether to enable case-insensitive matching. Defaults to False
         jobs: Number of parallel jobs to use. Auto-selects based on data size if None
         inplace: Whether to modify the original list. Defaults to False
@@ -61,20 +353,82 @@ def is_match(
         >>> yurki.regexp.is_match(['Hello', 'world'], r'^H', case=True)
         [True, False]
     """
-    if jobs is None:
-        jobs = __auto_select_jobs(data)
+    return _resolve_pattern(pattern, case).is_match(data, jobs, inplace)
+
+
+def is_match_mask(
+    data: list[str],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+) -> bytes:
+    """Check if each string matches the regex pattern, returning a compact mask.
 
-    return yurki.internal.is_match_regex_in_string(data, pattern, case, jobs, inplace)
+    Same matching as `is_match`, but the result is one byte per string instead of
+    a list of bools, which is what boolean-mask consumers (numpy, pandas, arrow)
+    usually want. Use `list(map(bool, mask))` to get the `is_match` result.
+
+    Args:
+        data: List of strings to test
+        pattern: Regular expression pattern to match against, or a compiled pattern
+        case: Whether to enable case-insensitive matching. Defaults to False
+        jobs: Number of parallel jobs to use. Auto-selects based on data size if None
+
+    Returns:
+        Bytes of the same length as `data`: 1 where the string matches, 0 otherwise.
+
+    Examples:
+        >>> yurki.regexp.is_match_mask(['test123', 'hello'], r'\\d+')
+        b'\\x01\\x00'
+    """
+    return _resolve_pattern(pattern, case).is_match_mask(data, jobs)
+
+
+def is_match_into(
+    data: list[str],
+    pattern: "str | Pattern",
+    out: Buffer,
+    case: bool = False,
+    jobs: int | None = None,
+) -> None:
+    """Check if each string matches the regex pattern, writing flags into `out`.
+
+    Same flags as `is_match_mask`, written into an existing buffer instead of a new
+    `bytes` object.
+
+    Args:
+        data: List of strings to test
+        pattern: Regular expression pattern to match against, or a compiled pattern
+        out: Writable, C-contiguous buffer with one item per string, e.g.
+            `array.array('b')`, `bytearray` or a numpy `uint8`/`int8`/`bool` array
+        case: Whether to enable case-insensitive matching. Defaults to False
+        jobs: Number of parallel jobs to use. Auto-selects based on data size if None
+
+    Raises:
+        TypeError: If `out` is read-only or not a buffer of one-byte items.
+        ValueError: If `out` is not contiguous or its length differs from `data`.
+
+    Examples:
+        >>> out = bytearray(2)
+        >>> yurki.regexp.is_match_into(['test123', 'hello'], r'\\d+', out)
+        >>> out
+        bytearray(b'\\x01\\x00')
+    """
+    _resolve_pattern(pattern, case).is_match_into(data, out, jobs)
 
 
 def capture(
-    data: list[str], pattern: str, case: bool = False, jobs: int | None = None, inplace: bool = False
+    data: list[str],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+    inplace: bool = False,
 ) -> list[list[str]]:
     """Capture regex groups from each string.
 
     Args:
         data: List of strings to capture from
-        pattern: Regular expression pattern with capture groups
+        pattern: Regular expression pattern with capture groups, or a compiled pattern
         case: Whether to enable case-insensitive matching. Defaults to False
         jobs: Number of parallel jobs to use. Auto-selects based on data size if None
         inplace: Whether to modify the original list. Defaults to False
@@ -98,20 +452,79 @@ def capture(
         >>> yurki.regexp.capture(['no match'], r'(\\d+)')
         [[]]
     """
-    if jobs is None:
-        jobs = __auto_select_jobs(data)
+    return _resolve_pattern(pattern, case).capture(data, jobs, inplace)
+
+
+def capture_flat(
+    data: list[str],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+) -> tuple[list[int], list[str]]:
+    """Capture regex groups from each string into one flat list.
+
+    Same groups as `capture`, laid out like an Arrow list array instead of one
+    list per string: `values[offsets[i]:offsets[i + 1]]` is the `capture` result
+    for `data[i]`. Avoids a list object per input row.
+
+    Args:
+        data: List of strings to capture from
+        pattern: Regular expression pattern with capture groups, or a compiled pattern
+        case: Whether to enable case-insensitive matching. Defaults to False
+        jobs: Number of parallel jobs to use. Auto-selects based on data size if None
+
+    Returns:
+        Tuple of `(offsets, values)`. `offsets` has `len(data) + 1` entries starting at 0;
+        `values` holds the groups of all matching strings, in input order.
+
+    Examples:
+        >>> yurki.regexp.capture_flat(['test 123', 'no match', 'abc 7'], r'(\\w+) (\\d+)')
+        ([0, 3, 3, 6], ['test 123', 'test', '123', 'abc 7', 'abc', '7'])
+    """
+    return _resolve_pattern(pattern, case).capture_flat(data, jobs)
+
+
+def capture_columns(
+    data: list[str],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+) -> list[list[str]]:
+    """Capture regex groups from each string into one list per group.
 
-    return yurki.internal.capture_regex_in_string(data, pattern, case, jobs, inplace)
+    Column-oriented counterpart of `capture`: `columns[j][i]` is group `j` of
+    `data[i]`, with group 0 the full match. Builds one list per group instead of
+    one per input row, ready to hand to column stores like pandas.
+
+    Args:
+        data: List of strings to capture from
+        pattern: Regular expression pattern with capture groups, or a compiled pattern
+        case: Whether to enable case-insensitive matching. Defaults to False
+        jobs: Number of parallel jobs to use. Auto-selects based on data size if None
+
+    Returns:
+        List with one entry per group (plus the full match), each a list of
+        `len(data)` strings. Strings without a match get empty strings in every column.
+
+    Examples:
+        >>> yurki.regexp.capture_columns(['test 123', 'no match', 'abc 7'], r'(\\w+) (\\d+)')
+        [['test 123', '', 'abc 7'], ['test', '', 'abc'], ['123', '', '7']]
+    """
+    return _resolve_pattern(pattern, case).capture_columns(data, jobs)
 
 
 def split(
-    data: list[str], pattern: str, case: bool = False, jobs: int | None = None, inplace: bool = False
+    data: list[str],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+    inplace: bool = False,
 ) -> list[list[str]]:
     """Split each string using a regex pattern as delimiter.
 
     Args:
         data: List of strings to split
-        pattern: Regular expression pattern to use as delimiter
+        pattern: Regular expression pattern to use as delimiter, or a compiled pattern
         case: Whether to enable case-insensitive matching. Defaults to False
         jobs: Number of parallel jobs to use. Auto-selects based on data size if None
         inplace: Whether to modify the original list. Defaults to False
@@ -129,15 +542,12 @@ def split(
         >>> yurki.regexp.split(['no-delimiters'], r',')
         [['no-delimiters']]
     """
-    if jobs is None:
-        jobs = __auto_select_jobs(data)
-
-    return yurki.internal.split_by_regexp_string(data, pattern, case, jobs, inplace)
+    return _resolve_pattern(pattern, case).split(data, jobs, inplace)
 
 
 def replace(
     data: list[str],
-    pattern: str,
+    pattern: "str | Pattern",
     replacement: str,
     count: int = 1,
     case: bool = False,
@@ -148,7 +558,7 @@ def replace(
 
     Args:
         data: List of strings to perform replacements on
-        pattern: Regular expression pattern to match
+        pattern: Regular expression pattern to match, or a compiled pattern
         replacement: String to replace matches with. Supports backreferences ($1, $2, etc.)
         count: Number of replacements to make per string:
             - 1 (default): Replace only the first match
@@ -163,6 +573,8 @@ def replace(
 
     Note:
         Uses Rust's backreference syntax ($1, $2, etc.) instead of Python's (\\1, \\2, etc.).
+        Patterns that are a plain alternation of literals (`foo|bar|baz`) are
+        replaced through the same single-pass search as `replace_multi`.
 
     Examples:
         >>> yurki.regexp.replace(['test hello test'], r'test', 'TEST')
@@ -177,10 +589,121 @@ def replace(
         >>> yurki.regexp.replace(['a1b2c3'], r'(\\w)(\\d)', r'$2$1', count=2)
         ['1a2bc3']
     """
-    if jobs is None:
-        jobs = __auto_select_jobs(data)
+    return _resolve_pattern(pattern, case).replace(data, replacement, count, jobs, inplace)
+
+
+def split_bytes(
+    data: list[bytes],
+    pattern: "str | Pattern",
+    case: bool = False,
+    jobs: int | None = None,
+) -> list[list[bytes]]:
+    """Split each bytes object using a regex pattern as delimiter.
+
+    Bytes counterpart of `split`, with the same pattern rules as `find_bytes`.
+
+    Args:
+        data: List of bytes objects to split
+        pattern: Regular expression pattern to use as delimiter, or a compiled pattern
+        case: Whether to enable case-insensitive matching. Defaults to False
+        jobs: Number of parallel jobs to use. Auto-selects based on data size if None
 
-    return yurki.internal.replace_regexp_in_string(data, pattern, replacement, count, case, jobs, inplace)
+    Returns:
+        List of lists of bytes, one list of parts per input.
+
+    Examples:
+        >>> yurki.regexp.split_bytes([b'a,b;c', b'\\xff,x'], r'[,;]')
+        [[b'a', b'b', b'c'], [b'\\xff', b'x']]
+    """
+    return _resolve_pattern(pattern, case).split_bytes(data, jobs)
 
 
-__all__ = ["find", "is_match", "capture", "split", "replace"]
+def replace_bytes(
+    data: list[bytes],
+    pattern: "str | Pattern",
+    replacement: bytes,
+    count: int = 1,
+    case: bool = False,
+    jobs: int | None = None,
+) -> list[bytes]:
+    """Replace regex matches in each bytes object.
+
+    Bytes counterpart of `replace`, with the same pattern rules as `find_bytes`.
+    Inputs without a match are returned as is.
+
+    Args:
+        data: List of bytes objects to perform replacements on
+        pattern: Regular expression pattern to match, or a compiled pattern
+        replacement: Bytes to replace matches with. Supports backreferences ($1, $2, etc.)
+        count: Number of replacements to make per input, 0 for all. Defaults to 1
+        case: Whether to enable case-insensitive matching. Defaults to False
+        jobs: Number of parallel jobs to use. Auto-selects based on data size if None
+
+    Returns:
+        List of bytes with replacements applied.
+
+    Examples:
+        >>> yurki.regexp.replace_bytes([b'GET /index 200'], r'\\d{3}', b'XXX')
+        [b'GET /index XXX']
+
+        >>> yurki.regexp.replace_bytes([b'k=v'], r'(\\w)=(\\w)', b'$2=$1')
+        [b'v=k']
+    """
+    return _resolve_pattern(pattern, case).replace_bytes(data, replacement, count, jobs)
+
+
+def replace_multi(
+    data: list[str],
+    patterns: list[str],
+    replacements: list[str],
+    jobs: int | None = None,
+    inplace: bool = False,
+) -> list[str]:
+    """Replace several literal strings in each string in a single pass.
+
+    All patterns are searched at once with Aho-Corasick, so the cost does not
+    grow with the number of patterns the way chained `replace` calls do. Every
+    occurrence is replaced; where patterns overlap, the leftmost match wins, and
+    among matches starting at the same position the one listed first.
+
+    Args:
+        data: List of strings to perform replacements on
+        patterns: Non-empty literal strings to search for (not regexes)
+        replacements: Replacement for each pattern, taken literally
+        jobs: Number of parallel jobs to use. Auto-selects based on data size if None
+        inplace: Whether to modify the original list. Defaults to False
+
+    Returns:
+        List of strings with replacements applied.
+
+    Examples:
+        >>> yurki.regexp.replace_multi(['cat and dog'], ['cat', 'dog'], ['dog', 'cat'])
+        ['dog and cat']
+
+        >>> yurki.regexp.replace_multi(['abc'], ['ab', 'abc'], ['1', '2'])
+        ['1c']
+    """
+    if jobs is None:
+        jobs = _auto_select_jobs(data)
+
+    return internal.replace_multi_in_string(data, patterns, replacements, jobs, inplace)
+
+
+__all__ = [
+    "Pattern",
+    "compile",
+    "precompiled",
+    "find",
+    "find_bytes",
+    "is_match",
+    "is_match_mask",
+    "is_match_into",
+    "capture",
+    "capture_flat",
+    "capture_columns",
+    "split",
+    "split_bytes",
+    "replace",
+    "replace_bytes",
+    "replace_multi",
+]